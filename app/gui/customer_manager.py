@@ -1,18 +1,32 @@
 """Customer management view for Gate Quote Pro."""
 import customtkinter as ctk
+import tkinter as tk
 from tkinter import messagebox
+from collections import OrderedDict
 from typing import Optional
 
-from ..models.customer import Customer
+from . import dispatch
+from .fonts import get_font
+from .quote_form import invalidate_customer_cache
+from ..models.customer import Customer, CustomerRow
+from ..models.quote import Quote
+from ..services._executor import executor
 
 
 class CustomerManager(ctk.CTkFrame):
     """View for managing customers."""
 
+    SEARCH_DELAY_MS = 250
+    HISTORY_CACHE_SIZE = 64
+
     def __init__(self, parent, main_window=None):
         super().__init__(parent, fg_color="transparent")
         self.main_window = main_window
         self.selected_customer: Optional[Customer] = None
+        self._quote_history_cache: OrderedDict = OrderedDict()
+        self._history_frame: Optional[ctk.CTkFrame] = None
+        # Top-level widgets of the details pane, tracked to avoid winfo_children()
+        self._detail_widgets = []
 
         self._create_layout()
         self._load_customers()
@@ -26,7 +40,7 @@ class CustomerManager(ctk.CTkFrame):
         title = ctk.CTkLabel(
             header,
             text="Customers",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title.pack(side="left")
 
@@ -41,8 +55,9 @@ class CustomerManager(ctk.CTkFrame):
         search_frame = ctk.CTkFrame(self, fg_color="transparent")
         search_frame.pack(fill="x", pady=(0, 15))
 
+        self._search_after_id = None
         self.search_var = ctk.StringVar()
-        self.search_var.trace_add("write", lambda *args: self._search())
+        self.search_var.trace_add("write", lambda *args: self._schedule_search())
 
         search_entry = ctk.CTkEntry(
             search_frame,
@@ -63,12 +78,38 @@ class CustomerManager(ctk.CTkFrame):
         list_header = ctk.CTkLabel(
             list_frame,
             text="Customer List",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         list_header.pack(anchor="w", padx=15, pady=10)
 
-        self.customer_list = ctk.CTkScrollableFrame(list_frame)
-        self.customer_list.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        # A flat tk.Listbox inserts rows in a single call, unlike a frame per customer
+        list_body = ctk.CTkFrame(list_frame, fg_color="transparent")
+        list_body.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        self.customer_list = tk.Listbox(
+            list_body,
+            borderwidth=0,
+            highlightthickness=0,
+            activestyle="none",
+            exportselection=False,
+            font=get_font()
+        )
+        scrollbar = ctk.CTkScrollbar(list_body, command=self.customer_list.yview)
+        self.customer_list.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.customer_list.pack(side="left", fill="both", expand=True)
+        self.customer_list.bind("<<ListboxSelect>>", self._on_list_select)
+
+        self._customers = []
+        self._load_generation = 0
+        self._apply_list_colors()
+        ctk.AppearanceModeTracker.add(self._apply_list_colors, self)
+
+        self.empty_label = ctk.CTkLabel(
+            list_body,
+            text="No customers found",
+            text_color="gray50"
+        )
 
         # Customer details
         self.detail_frame = ctk.CTkFrame(columns)
@@ -77,7 +118,7 @@ class CustomerManager(ctk.CTkFrame):
         detail_header = ctk.CTkLabel(
             self.detail_frame,
             text="Customer Details",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         detail_header.pack(anchor="w", padx=15, pady=10)
 
@@ -86,72 +127,96 @@ class CustomerManager(ctk.CTkFrame):
 
         self._show_empty_details()
 
-    def _load_customers(self, customers=None):
-        """Load customers into the list."""
-        for widget in self.customer_list.winfo_children():
-            widget.destroy()
+    def _load_customers(self, customers=None, query: str = ""):
+        """Load customers into the list.
 
-        if customers is None:
-            customers = Customer.get_all()
+        Without an explicit list, the customers matching query (all of them
+        when it is empty) are fetched on a background worker. A full load
+        shows a loading placeholder in the meantime; a search keeps the
+        current list until its results arrive.
+        """
+        self._load_generation += 1
 
-        if not customers:
-            empty = ctk.CTkLabel(
-                self.customer_list,
-                text="No customers found",
-                text_color="gray50"
-            )
-            empty.pack(pady=30)
+        if customers is None:
+            if query:
+                future = executor.submit(Customer.search_rows, query)
+            else:
+                self._customers = []
+                self.customer_list.delete(0, "end")
+                self.empty_label.configure(text="Loading...")
+                self.empty_label.place(relx=0.5, y=30, anchor="n")
+                future = executor.submit(Customer.get_all_rows)
+            dispatch.when_done(self, future, self._on_customers_loaded, self._load_generation)
             return
 
-        for customer in customers:
-            self._create_customer_row(customer)
+        self._customers = list(customers)
+        self.customer_list.delete(0, "end")
 
-    def _create_customer_row(self, customer: Customer):
-        """Create a row for a customer."""
-        row = ctk.CTkFrame(self.customer_list)
-        row.pack(fill="x", pady=3)
+        if self._customers:
+            self.empty_label.place_forget()
+            self.customer_list.insert("end", *[self._format_customer(c) for c in self._customers])
+        else:
+            self.empty_label.configure(text="No customers found")
+            self.empty_label.place(relx=0.5, y=30, anchor="n")
 
-        # Make clickable
-        row.bind("<Button-1>", lambda e, c=customer: self._select_customer(c))
+    def _on_customers_loaded(self, generation: int, future):
+        """Show a background customer fetch unless a newer load replaced it."""
+        if generation != self._load_generation:
+            return
+        if future.exception() is not None:
+            messagebox.showerror("Error", f"Failed to load customers: {future.exception()}")
+            return
+        self._load_customers(future.result())
+
+    @staticmethod
+    def _format_customer(customer: CustomerRow) -> str:
+        """Format a customer as a single list line."""
+        contact_text = " | ".join(filter(None, (customer.phone, customer.email)))
+        return f"{customer.name}  —  {contact_text}" if contact_text else customer.name
+
+    def _apply_list_colors(self, mode: str = None):
+        """Theme the tk.Listbox to match the current CTk appearance mode."""
+        mode_index = 1 if (mode or ctk.get_appearance_mode()) == "Dark" else 0
+        theme = ctk.ThemeManager.theme
+        self.customer_list.configure(
+            bg=theme["CTkFrame"]["top_fg_color"][mode_index],
+            fg=theme["CTkLabel"]["text_color"][mode_index],
+            selectbackground=theme["CTkButton"]["fg_color"][mode_index],
+            selectforeground="white"
+        )
 
-        info_frame = ctk.CTkFrame(row, fg_color="transparent")
-        info_frame.pack(side="left", fill="x", expand=True, padx=10, pady=8)
-        info_frame.bind("<Button-1>", lambda e, c=customer: self._select_customer(c))
+    def _on_list_select(self, event):
+        """Select the customer for the highlighted list line."""
+        selection = self.customer_list.curselection()
+        if not selection:
+            return
 
-        name_label = ctk.CTkLabel(
-            info_frame,
-            text=customer.name,
-            font=ctk.CTkFont(weight="bold"),
-            anchor="w"
-        )
-        name_label.pack(anchor="w")
-        name_label.bind("<Button-1>", lambda e, c=customer: self._select_customer(c))
-
-        contact_parts = []
-        if customer.phone:
-            contact_parts.append(customer.phone)
-        if customer.email:
-            contact_parts.append(customer.email)
-
-        if contact_parts:
-            contact_label = ctk.CTkLabel(
-                info_frame,
-                text=" | ".join(contact_parts),
-                text_color="gray50",
-                anchor="w"
-            )
-            contact_label.pack(anchor="w")
-            contact_label.bind("<Button-1>", lambda e, c=customer: self._select_customer(c))
+        # The list only holds listing rows; load the full customer for details
+        customer = Customer.get_by_id(self._customers[selection[0]].id)
+        if customer:
+            self._select_customer(customer)
+        else:
+            self._load_customers()
+
+    def refresh(self):
+        """Reload customers, keeping the current search."""
+        self._quote_history_cache.clear()
+        self._run_search()
 
     def _select_customer(self, customer: Customer):
         """Select a customer and show details."""
         self.selected_customer = customer
         self._show_customer_details(customer)
 
+    def _clear_details(self):
+        """Destroy the tracked top-level widgets of the details pane."""
+        for widget in self._detail_widgets:
+            widget.destroy()
+        self._detail_widgets.clear()
+
     def _show_empty_details(self):
         """Show empty state for details."""
-        for widget in self.detail_content.winfo_children():
-            widget.destroy()
+        self._clear_details()
 
         empty = ctk.CTkLabel(
             self.detail_content,
@@ -159,55 +224,62 @@ class CustomerManager(ctk.CTkFrame):
             text_color="gray50"
         )
         empty.pack(pady=50)
+        self._detail_widgets.append(empty)
 
     def _show_customer_details(self, customer: Customer):
         """Show customer details."""
-        for widget in self.detail_content.winfo_children():
-            widget.destroy()
+        # Build the details while detached so layout and paint happen once
+        self.detail_content.pack_forget()
+        self._clear_details()
 
         # Name
         name_label = ctk.CTkLabel(
             self.detail_content,
             text=customer.name,
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         name_label.pack(anchor="w", pady=(0, 15))
+        self._detail_widgets.append(name_label)
 
-        # Contact info
-        if customer.email:
-            email_row = ctk.CTkFrame(self.detail_content, fg_color="transparent")
-            email_row.pack(fill="x", pady=3)
-            ctk.CTkLabel(email_row, text="Email:", width=80, anchor="w").pack(side="left")
-            ctk.CTkLabel(email_row, text=customer.email, anchor="w").pack(side="left")
-
-        if customer.phone:
-            phone_row = ctk.CTkFrame(self.detail_content, fg_color="transparent")
-            phone_row.pack(fill="x", pady=3)
-            ctk.CTkLabel(phone_row, text="Phone:", width=80, anchor="w").pack(side="left")
-            ctk.CTkLabel(phone_row, text=customer.phone, anchor="w").pack(side="left")
-
-        if customer.address:
-            addr_row = ctk.CTkFrame(self.detail_content, fg_color="transparent")
-            addr_row.pack(fill="x", pady=3)
-            ctk.CTkLabel(addr_row, text="Address:", width=80, anchor="w").pack(side="left")
-            ctk.CTkLabel(addr_row, text=customer.address, anchor="w").pack(side="left")
-
+        # Contact info, laid out in one label/value grid
+        city_state = ""
         if customer.city or customer.state:
-            city_row = ctk.CTkFrame(self.detail_content, fg_color="transparent")
-            city_row.pack(fill="x", pady=3)
-            ctk.CTkLabel(city_row, text="", width=80).pack(side="left")
             city_state = f"{customer.city}, {customer.state} {customer.zip_code}".strip()
-            ctk.CTkLabel(city_row, text=city_state, anchor="w").pack(side="left")
+
+        fields = [
+            ("Email:", customer.email),
+            ("Phone:", customer.phone),
+            ("Address:", customer.address),
+            ("", city_state),
+        ]
+
+        details_grid = ctk.CTkFrame(self.detail_content, fg_color="transparent")
+        details_grid.pack(fill="x")
+        self._detail_widgets.append(details_grid)
+
+        for row_index, (label, value) in enumerate(fields):
+            if not value:
+                continue
+            ctk.CTkLabel(details_grid, text=label, width=80, anchor="w").grid(
+                row=row_index, column=0, sticky="w", pady=3
+            )
+            ctk.CTkLabel(details_grid, text=value, anchor="w").grid(
+                row=row_index, column=1, sticky="w", pady=3
+            )
 
         if customer.notes:
-            notes_row = ctk.CTkFrame(self.detail_content, fg_color="transparent")
-            notes_row.pack(fill="x", pady=(15, 3))
-            ctk.CTkLabel(notes_row, text="Notes:", anchor="w").pack(anchor="w")
-            ctk.CTkLabel(notes_row, text=customer.notes, anchor="w", wraplength=300).pack(anchor="w")
+            notes_row = len(fields)
+            ctk.CTkLabel(details_grid, text="Notes:", anchor="w").grid(
+                row=notes_row, column=0, columnspan=2, sticky="w", pady=(15, 3)
+            )
+            ctk.CTkLabel(details_grid, text=customer.notes, anchor="w", wraplength=300).grid(
+                row=notes_row + 1, column=0, columnspan=2, sticky="w"
+            )
 
         # Action buttons
         btn_frame = ctk.CTkFrame(self.detail_content, fg_color="transparent")
         btn_frame.pack(fill="x", pady=20)
+        self._detail_widgets.append(btn_frame)
 
         edit_btn = ctk.CTkButton(
             btn_frame,
@@ -237,35 +309,77 @@ class CustomerManager(ctk.CTkFrame):
         )
         delete_btn.pack(side="left")
 
-        # Quote history
-        from ..models.quote import Quote
-        quotes = Quote.get_by_customer(customer.id)
+        # Quote history is filled in once the background lookup finishes
+        self._history_frame = ctk.CTkFrame(self.detail_content, fg_color="transparent")
+        self._history_frame.pack(fill="x")
+        self._detail_widgets.append(self._history_frame)
+
+        if customer.id in self._quote_history_cache:
+            self._quote_history_cache.move_to_end(customer.id)
+            self._render_quote_history(customer.id, self._quote_history_cache[customer.id])
+        else:
+            future = executor.submit(Quote.get_summary_by_customer, customer.id, 5)
+            dispatch.when_done(self, future, self._on_quote_history_loaded, customer.id)
+
+        self.detail_content.update_idletasks()
+        self.detail_content.pack(fill="both", expand=True, padx=15, pady=10)
+
+    def _on_quote_history_loaded(self, customer_id: int, future):
+        """Cache a finished quote history lookup and render it if still relevant."""
+        if future.exception() is not None:
+            return
+
+        rows = future.result()
+        self._quote_history_cache[customer_id] = rows
+        while len(self._quote_history_cache) > self.HISTORY_CACHE_SIZE:
+            self._quote_history_cache.popitem(last=False)
+
+        self._render_quote_history(customer_id, rows)
 
-        if quotes:
+    def _render_quote_history(self, customer_id: int, rows):
+        """Render the quote history summary for the selected customer."""
+        if (
+            not self.selected_customer
+            or self.selected_customer.id != customer_id
+            or not self._history_frame.winfo_exists()
+        ):
+            return
+
+        if rows:
             history_label = ctk.CTkLabel(
-                self.detail_content,
-                text=f"Quote History ({len(quotes)})",
-                font=ctk.CTkFont(size=14, weight="bold")
+                self._history_frame,
+                text=f"Quote History ({rows[0]['quote_count']})",
+                font=get_font(14, "bold")
             )
             history_label.pack(anchor="w", pady=(20, 10))
 
-            for quote in quotes[:5]:  # Show last 5
-                quote_row = ctk.CTkFrame(self.detail_content, fg_color="transparent")
+            for quote in rows:
+                quote_row = ctk.CTkFrame(self._history_frame, fg_color="transparent")
                 quote_row.pack(fill="x", pady=2)
 
                 ctk.CTkLabel(
                     quote_row,
-                    text=f"{quote.quote_number} - ${quote.total:.2f} ({quote.status})"
+                    text=f"{quote['quote_number']} - ${quote['total'] or 0:.2f} ({quote['status']})"
                 ).pack(side="left")
 
-    def _search(self):
+    def destroy(self):
+        """Cancel any pending search before tearing down the view."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        ctk.AppearanceModeTracker.remove(self._apply_list_colors)
+        super().destroy()
+
+    def _schedule_search(self):
+        """Debounce search so only the last keystroke in a burst runs a query."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.SEARCH_DELAY_MS, self._run_search)
+
+    def _run_search(self):
         """Search customers."""
-        query = self.search_var.get().strip()
-        if query:
-            customers = Customer.search(query)
-        else:
-            customers = Customer.get_all()
-        self._load_customers(customers)
+        self._search_after_id = None
+        self._load_customers(query=self.search_var.get().strip())
 
     def _add_customer(self):
         """Add a new customer."""
@@ -292,12 +406,15 @@ class CustomerManager(ctk.CTkFrame):
             f"Are you sure you want to delete {customer.name}?\n\nThis will NOT delete their quotes."
         ):
             customer.delete()
+            invalidate_customer_cache()
+            self._quote_history_cache.pop(customer.id, None)
             self._load_customers()
             self._show_empty_details()
 
     def _new_quote_for_customer(self, customer: Customer):
         """Create a new quote for this customer."""
-        from ..models.quote import Quote
+        # The new quote will change this customer's history
+        self._quote_history_cache.pop(customer.id, None)
 
         quote = Quote()
         quote.customer_id = customer.id
@@ -310,44 +427,50 @@ class CustomerManager(ctk.CTkFrame):
 class CustomerEditDialog(ctk.CTkToplevel):
     """Dialog for editing a customer."""
 
+    # (label, Customer attribute) for each single-line entry
+    FIELDS = (
+        ("Name*:", "name"),
+        ("Email:", "email"),
+        ("Phone:", "phone"),
+        ("Address:", "address"),
+        ("City:", "city"),
+        ("State:", "state"),
+        ("ZIP:", "zip_code"),
+    )
+
     def __init__(self, parent, customer: Customer = None):
         super().__init__(parent)
         self.customer = customer or Customer()
         self.result: Optional[Customer] = None
 
+        # Build the form while withdrawn so the dialog appears in one paint
+        self.withdraw()
+
         self.title("Edit Customer" if customer else "New Customer")
         self.geometry("450x500")
         self.resizable(False, False)
 
-        self.transient(parent)
-        self.grab_set()
-
         self._create_form()
 
+        self.update_idletasks()
+        self.deiconify()
+        self.transient(parent)
+        self.after(1, self.grab_set)
+
     def _create_form(self):
         """Create the form."""
         frame = ctk.CTkFrame(self, fg_color="transparent")
         frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-        fields = [
-            ("Name*:", "name", self.customer.name),
-            ("Email:", "email", self.customer.email),
-            ("Phone:", "phone", self.customer.phone),
-            ("Address:", "address", self.customer.address),
-            ("City:", "city", self.customer.city),
-            ("State:", "state", self.customer.state),
-            ("ZIP:", "zip_code", self.customer.zip_code),
-        ]
-
         self.entries = {}
 
-        for label_text, field_name, value in fields:
+        for label_text, field_name in self.FIELDS:
             row = ctk.CTkFrame(frame, fg_color="transparent")
             row.pack(fill="x", pady=5)
 
             ctk.CTkLabel(row, text=label_text, width=80).pack(side="left")
             entry = ctk.CTkEntry(row, width=280)
-            entry.insert(0, value or "")
+            entry.insert(0, getattr(self.customer, field_name) or "")
             entry.pack(side="left")
             self.entries[field_name] = entry
 
@@ -395,5 +518,6 @@ class CustomerEditDialog(ctk.CTkToplevel):
         self.customer.notes = self.notes_text.get("1.0", "end").strip()
 
         self.customer.save()
+        invalidate_customer_cache()
         self.result = self.customer
         self.destroy()
@@ -0,0 +1,34 @@
+"""Hand work from background threads back to the Tk thread."""
+import queue
+from concurrent.futures import Future
+
+# Milliseconds between checks for queued callbacks
+POLL_MS = 50
+
+_pending: 'queue.Queue' = queue.Queue()
+
+
+def post(widget, callback, *args):
+    """Run callback(*args) on the Tk thread if widget still exists. Safe from any thread."""
+    _pending.put((widget, callback, args))
+
+
+def when_done(widget, future: Future, callback, *args):
+    """Run callback(*args, future) on the Tk thread once future finishes."""
+    future.add_done_callback(lambda f: post(widget, callback, *args, f))
+
+
+def start(root):
+    """Drain queued callbacks on root's event loop for as long as it runs."""
+    def drain():
+        # Rescheduled first so a failing callback can't stop the polling
+        root.after(POLL_MS, drain)
+        while True:
+            try:
+                widget, callback, args = _pending.get_nowait()
+            except queue.Empty:
+                return
+            if widget.winfo_exists():
+                callback(*args)
+
+    drain()
@@ -0,0 +1,12 @@
+"""Shared font objects for Gate Quote Pro views."""
+from functools import lru_cache
+from typing import Optional
+
+import customtkinter as ctk
+
+
+@lru_cache(maxsize=32)
+def get_font(size: Optional[int] = None, weight: str = "normal",
+             family: Optional[str] = None) -> ctk.CTkFont:
+    """Get a shared CTkFont, created on first use (after the root window exists)."""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
@@ -1,13 +1,27 @@
 """Main application window for Gate Quote Pro."""
 import customtkinter as ctk
+from tkinter import messagebox
 from typing import Optional
 
 from .quote_form import QuoteForm
 from .customer_manager import CustomerManager
 from .price_list import PriceListManager
 from .settings import SettingsPanel
+from . import dispatch
+from .fonts import get_font
 from ..models.database import get_db
 from ..models.materials import Material
+from ..utils.system import open_file
+from ..services._executor import executor
+
+# Status badge colors (light, dark)
+STATUS_COLORS = {
+    'draft': ('gray70', 'gray30'),
+    'sent': ('#3182ce', '#2b6cb0'),
+    'accepted': ('#38a169', '#2f855a'),
+    'declined': ('#e53e3e', '#c53030')
+}
+DEFAULT_STATUS_COLOR = STATUS_COLORS['draft']
 
 
 class MainWindow(ctk.CTk):
@@ -25,6 +39,9 @@ class MainWindow(ctk.CTk):
         ctk.set_appearance_mode("system")
         ctk.set_default_color_theme("blue")
 
+        # Run results handed back from background workers
+        dispatch.start(self)
+
         # Initialize database and load defaults
         self._init_database()
 
@@ -54,7 +71,7 @@ class MainWindow(ctk.CTk):
         title_label = ctk.CTkLabel(
             title_frame,
             text="Gate Quote Pro",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         title_label.pack()
 
@@ -79,7 +96,7 @@ class MainWindow(ctk.CTk):
                 fg_color="transparent",
                 text_color=("gray10", "gray90"),
                 hover_color=("gray70", "gray30"),
-                font=ctk.CTkFont(size=14)
+                font=get_font(14)
             )
             btn.pack(fill="x", padx=10, pady=5)
             self.nav_buttons[key] = btn
@@ -92,7 +109,7 @@ class MainWindow(ctk.CTk):
         version_label = ctk.CTkLabel(
             self.sidebar,
             text="v1.0.0",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="gray50"
         )
         version_label.pack(pady=10)
@@ -106,8 +123,10 @@ class MainWindow(ctk.CTk):
         self.view_container = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         self.view_container.pack(fill="both", expand=True, padx=20, pady=20)
 
-        # Current view reference
+        # Current view reference, and views kept alive between navigations
         self.current_view: Optional[ctk.CTkFrame] = None
+        self._views: dict = {}
+        self._quote_form: Optional[QuoteForm] = None
 
     def _set_active_nav(self, active_key: str):
         """Set the active navigation button."""
@@ -117,46 +136,67 @@ class MainWindow(ctk.CTk):
             else:
                 btn.configure(fg_color="transparent")
 
-    def _clear_view(self):
-        """Clear current view."""
+    def _hide_current(self):
+        """Hide the current view, keeping cached views alive."""
         if self.current_view:
-            self.current_view.destroy()
+            self.current_view.pack_forget()
             self.current_view = None
 
+    def _show_view(self, key: str, factory, refresh: bool = True):
+        """Show a cached view, creating it on first use.
+
+        Views that were already built are refreshed instead of rebuilt.
+        """
+        self._hide_current()
+        self._set_active_nav(key)
+
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = factory()
+        elif refresh:
+            view.refresh()
+
+        self.current_view = view
+        view.pack(fill="both", expand=True)
+
     def show_quote_form(self, quote=None):
         """Show the quote creation/edit form."""
-        self._clear_view()
+        self._hide_current()
         self._set_active_nav("new_quote")
-        self.current_view = QuoteForm(self.view_container, quote=quote, main_window=self)
+
+        # The form is bound to a specific quote, so it is rebuilt each time
+        if self._quote_form is not None:
+            self._quote_form.destroy()
+        self._quote_form = QuoteForm(self.view_container, quote=quote, main_window=self)
+
+        self.current_view = self._quote_form
         self.current_view.pack(fill="both", expand=True)
 
     def show_quote_history(self):
         """Show quote history list."""
-        self._clear_view()
-        self._set_active_nav("quotes")
-        self.current_view = QuoteHistoryView(self.view_container, main_window=self)
-        self.current_view.pack(fill="both", expand=True)
+        self._show_view(
+            "quotes",
+            lambda: QuoteHistoryView(self.view_container, main_window=self)
+        )
 
     def show_customers(self):
         """Show customer management view."""
-        self._clear_view()
-        self._set_active_nav("customers")
-        self.current_view = CustomerManager(self.view_container, main_window=self)
-        self.current_view.pack(fill="both", expand=True)
+        self._show_view(
+            "customers",
+            lambda: CustomerManager(self.view_container, main_window=self)
+        )
 
     def show_price_list(self):
         """Show price list management view."""
-        self._clear_view()
-        self._set_active_nav("price_list")
-        self.current_view = PriceListManager(self.view_container, main_window=self)
-        self.current_view.pack(fill="both", expand=True)
+        self._show_view(
+            "price_list",
+            lambda: PriceListManager(self.view_container, main_window=self)
+        )
 
     def show_settings(self):
         """Show settings panel."""
-        self._clear_view()
-        self._set_active_nav("settings")
-        self.current_view = SettingsPanel(self.view_container)
-        self.current_view.pack(fill="both", expand=True)
+        # Settings only change from this panel, so there is nothing to reload
+        self._show_view("settings", lambda: SettingsPanel(self.view_container), refresh=False)
 
 
 class QuoteHistoryView(ctk.CTkFrame):
@@ -173,7 +213,7 @@ class QuoteHistoryView(ctk.CTkFrame):
         title = ctk.CTkLabel(
             header,
             text="Quote History",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title.pack(side="left")
 
@@ -203,73 +243,82 @@ class QuoteHistoryView(ctk.CTkFrame):
         self.list_frame = ctk.CTkScrollableFrame(self)
         self.list_frame.pack(fill="both", expand=True)
 
+        self.empty_label = ctk.CTkLabel(
+            self.list_frame,
+            text="No quotes found",
+            text_color="gray50"
+        )
+
+        # Pool of quote row widgets, reused across reloads
+        self._quote_rows = []
+        self._shown_rows = 0
+
         self._load_quotes()
 
     def _load_quotes(self, status: str = None):
         """Load quotes from database."""
         from ..models.quote import Quote
 
-        # Clear existing
-        for widget in self.list_frame.winfo_children():
-            widget.destroy()
+        # Build rows while the list is detached so layout and paint happen once
+        self.list_frame.pack_forget()
+
+        quotes = Quote.get_all_rows(status=status.lower() if status and status != "All" else None)
 
-        quotes = Quote.get_all(status=status.lower() if status and status != "All" else None)
+        # Reuse pooled row widgets; only create or hide the difference
+        for index, quote in enumerate(quotes):
+            if index < len(self._quote_rows):
+                row = self._quote_rows[index]
+            else:
+                row = self._create_quote_row()
+                self._quote_rows.append(row)
+            self._update_quote_row(row, quote)
+            if index >= self._shown_rows:
+                row.pack(fill="x", pady=5)
+
+        for row in self._quote_rows[len(quotes):self._shown_rows]:
+            row.pack_forget()
+        self._shown_rows = len(quotes)
 
         if not quotes:
-            empty_label = ctk.CTkLabel(
-                self.list_frame,
-                text="No quotes found",
-                text_color="gray50"
-            )
-            empty_label.pack(pady=50)
-            return
+            self.empty_label.pack(pady=50)
+        else:
+            self.empty_label.pack_forget()
 
-        for quote in quotes:
-            self._create_quote_row(quote)
+        self.list_frame.update_idletasks()
+        self.list_frame.pack(fill="both", expand=True)
 
-    def _create_quote_row(self, quote):
-        """Create a row for a quote."""
+    def _create_quote_row(self) -> ctk.CTkFrame:
+        """Create an empty quote row; its content is set by _update_quote_row."""
         row = ctk.CTkFrame(self.list_frame)
-        row.pack(fill="x", pady=5)
+        row.quote = None
 
         # Quote info
         info_frame = ctk.CTkFrame(row, fg_color="transparent")
         info_frame.pack(side="left", fill="x", expand=True, padx=10, pady=10)
 
-        quote_num = ctk.CTkLabel(
+        row.quote_num_label = ctk.CTkLabel(
             info_frame,
-            text=quote.quote_number,
-            font=ctk.CTkFont(weight="bold")
+            text="",
+            font=get_font(weight="bold")
         )
-        quote_num.pack(anchor="w")
+        row.quote_num_label.pack(anchor="w")
 
-        customer_name = quote.customer.name if quote.customer else "No customer"
-        details = f"{customer_name} | {quote.gate_type.title()} {quote.width}ft x {quote.height}ft | ${quote.total:.2f}"
-        details_label = ctk.CTkLabel(
+        row.details_label = ctk.CTkLabel(
             info_frame,
-            text=details,
+            text="",
             text_color="gray50"
         )
-        details_label.pack(anchor="w")
+        row.details_label.pack(anchor="w")
 
         # Status badge
-        status_colors = {
-            'draft': ('gray70', 'gray30'),
-            'sent': ('#3182ce', '#2b6cb0'),
-            'accepted': ('#38a169', '#2f855a'),
-            'declined': ('#e53e3e', '#c53030')
-        }
-
-        status_color = status_colors.get(quote.status, ('gray70', 'gray30'))
-        status_badge = ctk.CTkLabel(
+        row.status_badge = ctk.CTkLabel(
             row,
-            text=quote.status.upper(),
-            fg_color=status_color,
+            text="",
             corner_radius=4,
             width=80,
             height=24
         )
-        status_badge.pack(side="right", padx=10)
+        row.status_badge.pack(side="right", padx=10)
 
         # Action buttons
         btn_frame = ctk.CTkFrame(row, fg_color="transparent")
@@ -280,7 +329,7 @@ class QuoteHistoryView(ctk.CTkFrame):
             text="Edit",
             width=60,
             height=28,
-            command=lambda q=quote: self._edit_quote(q)
+            command=lambda r=row: self._edit_quote(r.quote)
         )
         edit_btn.pack(side="left", padx=2)
 
@@ -291,10 +340,28 @@ class QuoteHistoryView(ctk.CTkFrame):
             height=28,
             fg_color="green",
             hover_color="darkgreen",
-            command=lambda q=quote: self._generate_pdf(q)
+            command=lambda r=row: self._generate_pdf(r.quote)
         )
         pdf_btn.pack(side="left", padx=2)
 
+        return row
+
+    def _update_quote_row(self, row: ctk.CTkFrame, quote):
+        """Show a quote in a (possibly reused) row."""
+        row.quote = quote
+        row.quote_num_label.configure(text=quote.quote_number)
+
+        customer_name = quote.customer_name or "No customer"
+        details = f"{customer_name} | {quote.gate_type.title()} {quote.width}ft x {quote.height}ft | ${quote.total:.2f}"
+        row.details_label.configure(text=details)
+
+        status_color = STATUS_COLORS.get(quote.status, DEFAULT_STATUS_COLOR)
+        row.status_badge.configure(text=quote.status.upper(), fg_color=status_color)
+
+    def refresh(self):
+        """Reload the list, keeping the current status filter."""
+        self._filter_quotes(self.status_filter.get())
+
     def _filter_quotes(self, status: str):
         """Filter quotes by status."""
         self._load_quotes(status if status != "All" else None)
@@ -307,15 +374,28 @@ class QuoteHistoryView(ctk.CTkFrame):
             self.main_window.show_quote_form(quote=full_quote)
 
     def _generate_pdf(self, quote):
-        """Generate PDF for quote."""
+        """Generate PDF for quote in the background, then open it."""
+        future = executor.submit(self._build_pdf, quote.id)
+        dispatch.when_done(self, future, self._on_pdf_built)
+
+    @staticmethod
+    def _build_pdf(quote_id: int) -> Optional[str]:
+        """Load the full quote and write its PDF. Runs on a worker thread."""
         from ..models.quote import Quote
         from ..services.pdf_generator import get_pdf_generator
-        import subprocess
 
-        full_quote = Quote.get_by_id(quote.id)
-        if full_quote:
-            generator = get_pdf_generator()
-            pdf_path = generator.generate(full_quote)
+        full_quote = Quote.get_by_id(quote_id)
+        if not full_quote:
+            return None
+        return get_pdf_generator().generate(full_quote)
+
+    def _on_pdf_built(self, future):
+        """Open the generated PDF, or report why it failed."""
+        try:
+            pdf_path = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to generate PDF: {e}")
+            return
 
-            # Open the PDF
-            subprocess.run(['open', pdf_path])
+        if pdf_path:
+            open_file(pdf_path)
@@ -1,20 +1,44 @@
 """Price list management view for Gate Quote Pro."""
 import customtkinter as ctk
-from tkinter import messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog
+import math
+import sys
 import webbrowser
 from typing import Optional
+from urllib.parse import quote_plus
 
+from . import dispatch
+from .fonts import get_font
 from ..models.materials import Material
-from ..services.supplier_api import get_supplier_api, PriceResult
+from ..services._executor import executor
+from ..services.supplier_api import SupplierAPI, get_supplier_api, PriceResult
 
 
 class PriceListManager(ctk.CTkFrame):
     """View for managing the price list."""
 
+    # (column key, heading, width) for the materials table
+    COLUMNS = [
+        ("category", "Category", 100),
+        ("name", "Name", 250),
+        ("unit", "Unit", 60),
+        ("cost", "Cost", 80),
+        ("markup", "Markup", 70),
+        ("supplier", "Supplier", 100),
+    ]
+    ROW_HEIGHT = 28
+    SEARCH_DELAY_MS = 150
+    # Extra rows kept in the table beyond the visible window
+    OVERSCAN = 2
+
     def __init__(self, parent, main_window=None):
         super().__init__(parent, fg_color="transparent")
         self.main_window = main_window
         self.selected_material: Optional[Material] = None
+        # (name_lower, category, material) for every material, built lazily
+        self._index = None
+        self._categories = set()
+        self._price_url = None
 
         self._create_layout()
         self._load_materials()
@@ -28,7 +52,7 @@ class PriceListManager(ctk.CTkFrame):
         title = ctk.CTkLabel(
             header,
             text="Price List",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title.pack(side="left")
 
@@ -65,7 +89,8 @@ class PriceListManager(ctk.CTkFrame):
 
         ctk.CTkLabel(filter_frame, text="Category:").pack(side="left", padx=(0, 5))
 
-        categories = ["All"] + Material.get_categories()
+        categories = ["All"] + self._sorted_categories()
+        self._last_category_values = categories
         self.category_var = ctk.StringVar(value="All")
         self.category_filter = ctk.CTkComboBox(
             filter_frame,
@@ -77,8 +102,9 @@ class PriceListManager(ctk.CTkFrame):
         self.category_filter.pack(side="left", padx=(0, 20))
 
         ctk.CTkLabel(filter_frame, text="Search:").pack(side="left", padx=(0, 5))
+        self._search_after_id = None
         self.search_var = ctk.StringVar()
-        self.search_var.trace_add("write", lambda *args: self._filter_materials())
+        self.search_var.trace_add("write", lambda *args: self._schedule_filter())
         search_entry = ctk.CTkEntry(
             filter_frame,
             textvariable=self.search_var,
@@ -87,55 +113,107 @@ class PriceListManager(ctk.CTkFrame):
         )
         search_entry.pack(side="left")
 
-        # Materials table
-        table_frame = ctk.CTkFrame(self)
-        table_frame.pack(fill="both", expand=True)
+        # Edit/delete act on the selected table row
+        delete_btn = ctk.CTkButton(
+            filter_frame,
+            text="Delete",
+            width=70,
+            fg_color="red",
+            hover_color="darkred",
+            command=self._delete_selected
+        )
+        delete_btn.pack(side="right", padx=(5, 0))
 
-        # Table header
-        header_frame = ctk.CTkFrame(table_frame, fg_color=("gray85", "gray25"))
-        header_frame.pack(fill="x")
-
-        headers = [
-            ("Category", 100),
-            ("Name", 250),
-            ("Unit", 60),
-            ("Cost", 80),
-            ("Markup", 70),
-            ("Supplier", 100),
-            ("Actions", 120)
-        ]
+        edit_btn = ctk.CTkButton(
+            filter_frame,
+            text="Edit",
+            width=70,
+            command=self._edit_selected
+        )
+        edit_btn.pack(side="right")
 
-        for text, width in headers:
-            ctk.CTkLabel(
-                header_frame,
-                text=text,
-                width=width,
-                font=ctk.CTkFont(weight="bold")
-            ).pack(side="left", padx=5, pady=8)
+        # Materials table: one Treeview instead of a widget tree per row
+        table_frame = ctk.CTkFrame(self)
+        table_frame.pack(fill="both", expand=True)
 
-        # Scrollable content
-        self.table_content = ctk.CTkScrollableFrame(table_frame)
-        self.table_content.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(
+            table_frame,
+            columns=[key for key, _, _ in self.COLUMNS],
+            show="headings",
+            selectmode="browse",
+            style="PriceList.Treeview"
+        )
+        for key, text, width in self.COLUMNS:
+            self.tree.heading(key, text=text, anchor="w")
+            self.tree.column(key, width=width, anchor="w")
+
+        # The table only ever holds the visible window of rows, so the
+        # scrollbar is driven from the full list rather than the Treeview.
+        self.scrollbar = ctk.CTkScrollbar(table_frame, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=5)
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Double-1>", lambda e: self._edit_selected())
+        self.tree.bind("<Configure>", self._reflow)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", self._on_mousewheel)
+        self.tree.bind("<Button-5>", self._on_mousewheel)
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._move_selection(-self._visible_row_count()))
+        self.tree.bind("<Next>", lambda e: self._move_selection(self._visible_row_count()))
+
+        self._all_materials = []
+        self._materials_by_id = {}
+        # iid -> Material currently inserted in the Treeview
+        self._rendered = {}
+        self._first = 0
+        self._row_height = self.ROW_HEIGHT
+        self._heading_height = 0
+        self._row_height_measured = False
+        self._apply_tree_style()
+        ctk.AppearanceModeTracker.add(self._apply_tree_style, self)
+
+        self.empty_label = ctk.CTkLabel(
+            table_frame,
+            text="No materials found. Add items or import from CSV.",
+            text_color="gray50"
+        )
 
-        # Price check section
-        self._create_price_check_section()
+        # Price check section, built on first expand
+        self.price_section = None
+        self._price_toggle = ctk.CTkButton(
+            self,
+            text="Check Supplier Prices ▸",
+            font=get_font(16, "bold"),
+            fg_color="transparent",
+            text_color=("gray10", "gray90"),
+            hover_color=("gray80", "gray30"),
+            anchor="w",
+            command=self._toggle_price_section
+        )
+        self._price_toggle.pack(fill="x", pady=(15, 0))
+
+    def _toggle_price_section(self):
+        """Show or hide the supplier price check section."""
+        if self.price_section is None:
+            self._create_price_check_section()
+        elif self.price_section.winfo_manager():
+            self.price_section.pack_forget()
+            self._price_toggle.configure(text="Check Supplier Prices ▸")
+            return
+        else:
+            self.price_section.pack(fill="x")
+        self._price_toggle.configure(text="Check Supplier Prices ▾")
 
     def _create_price_check_section(self):
         """Create the supplier price check section."""
-        section = ctk.CTkFrame(self)
-        section.pack(fill="x", pady=(15, 0))
-
-        header = ctk.CTkFrame(section, fg_color="transparent")
-        header.pack(fill="x", padx=15, pady=10)
-
-        ctk.CTkLabel(
-            header,
-            text="Check Supplier Prices",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(side="left")
+        self.price_section = ctk.CTkFrame(self)
+        self.price_section.pack(fill="x")
 
-        content = ctk.CTkFrame(section, fg_color="transparent")
-        content.pack(fill="x", padx=15, pady=(0, 15))
+        content = ctk.CTkFrame(self.price_section, fg_color="transparent")
+        content.pack(fill="x", padx=15, pady=15)
 
         # URL input
         url_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -162,21 +240,14 @@ class PriceListManager(ctk.CTkFrame):
 
         ctk.CTkLabel(links_frame, text="Quick Search:").pack(side="left", padx=(0, 10))
 
-        suppliers = [
-            ("Home Depot", "https://www.homedepot.com/s/{query}"),
-            ("Lowe's", "https://www.lowes.com/search?searchTerm={query}"),
-            ("Tractor Supply", "https://www.tractorsupply.com/tsc/search/{query}"),
-            ("Walmart", "https://www.walmart.com/search?q={query}")
-        ]
-
-        for name, url_template in suppliers:
+        for supplier in SupplierAPI.SUPPLIERS.values():
             btn = ctk.CTkButton(
                 links_frame,
-                text=name,
+                text=supplier['name'],
                 width=100,
                 height=28,
                 fg_color="gray50",
-                command=lambda u=url_template: self._open_supplier_search(u)
+                command=lambda u=supplier['search_url']: self._open_supplier_search(u)
             )
             btn.pack(side="left", padx=3)
 
@@ -186,105 +257,268 @@ class PriceListManager(ctk.CTkFrame):
 
     def _load_materials(self, materials=None):
         """Load materials into the table."""
-        for widget in self.table_content.winfo_children():
-            widget.destroy()
-
         if materials is None:
-            materials = Material.get_all()
-
-        if not materials:
-            empty = ctk.CTkLabel(
-                self.table_content,
-                text="No materials found. Add items or import from CSV.",
-                text_color="gray50"
-            )
-            empty.pack(pady=30)
-            return
-
-        for material in materials:
-            self._create_material_row(material)
+            materials = [m for _, _, m in self._get_index()]
 
-    def _create_material_row(self, material: Material):
-        """Create a row for a material."""
-        row = ctk.CTkFrame(self.table_content, fg_color="transparent")
-        row.pack(fill="x", pady=2)
-
-        ctk.CTkLabel(row, text=material.category, width=100, anchor="w").pack(side="left", padx=5)
-        ctk.CTkLabel(row, text=material.name[:35], width=250, anchor="w").pack(side="left", padx=5)
-        ctk.CTkLabel(row, text=material.unit, width=60).pack(side="left", padx=5)
-        ctk.CTkLabel(row, text=f"${material.cost:.2f}", width=80).pack(side="left", padx=5)
-        ctk.CTkLabel(row, text=f"{(material.markup - 1) * 100:.0f}%", width=70).pack(side="left", padx=5)
-        ctk.CTkLabel(row, text=material.supplier[:12] if material.supplier else "-", width=100, anchor="w").pack(side="left", padx=5)
+        # Rows already in the table are kept and diffed by _reflow
+        self._all_materials = list(materials)
+        self._materials_by_id = {str(m.id): m for m in self._all_materials}
+        if self.selected_material:
+            self.selected_material = self._materials_by_id.get(str(self.selected_material.id))
+        if not self.selected_material:
+            self.tree.selection_remove(*self.tree.selection())
+        self._first = 0
+        self._reflow()
+
+        if materials:
+            self.empty_label.place_forget()
+        else:
+            self.empty_label.place(relx=0.5, y=60, anchor="n")
+
+    def _visible_row_count(self) -> int:
+        """Number of rows that fit in the table viewport."""
+        height = self.tree.winfo_height() - self._heading_height
+        return max(1, math.ceil(height / self._row_height))
+
+    def _reflow(self, event=None):
+        """Show the slice of materials under the virtual scroll position."""
+        total = len(self._all_materials)
+        visible = self._visible_row_count()
+        self._first = max(0, min(self._first, total - visible))
+
+        window = self._all_materials[self._first:self._first + visible + self.OVERSCAN]
+        wanted = [str(m.id) for m in window]
+        wanted_set = set(wanted)
+
+        # Keyed diff against the rows already in the table: delete rows that
+        # left, insert new ones by position, and only touch survivors whose
+        # material was reloaded or whose position changed.
+        stale = [iid for iid in self._rendered if iid not in wanted_set]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._rendered[iid]
+        for index, (iid, material) in enumerate(zip(wanted, window)):
+            rendered = self._rendered.get(iid)
+            if rendered is None:
+                self.tree.insert("", index, iid=iid, values=self._row_values(material))
+            else:
+                if rendered is not material:
+                    self.tree.item(iid, values=self._row_values(material))
+                if self.tree.index(iid) != index:
+                    self.tree.move(iid, "", index)
+            self._rendered[iid] = material
+
+        selected = self.selected_material
+        if selected and str(selected.id) in wanted_set and not self.tree.selection():
+            self.tree.selection_set(str(selected.id))
+        self.tree.yview_moveto(0)
+
+        if not self._row_height_measured and wanted:
+            bbox = self.tree.bbox(wanted[0])
+            if bbox:
+                self._heading_height = bbox[1]
+                self._row_height = bbox[3]
+                self._row_height_measured = True
+
+        if total:
+            self.scrollbar.set(self._first / total, min(1.0, (self._first + visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """Translate scrollbar commands into a new window position."""
+        if action == "moveto":
+            self._first = int(float(amount) * len(self._all_materials))
+        elif action == "scroll":
+            step = self._visible_row_count() if unit == "pages" else 1
+            self._first += int(amount) * step
+        self._reflow()
+
+    def _on_mousewheel(self, event):
+        """Scroll the virtual window with the mouse wheel."""
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -int(event.delta / 40)
+        self._on_scrollbar("scroll", delta, "units")
+        return "break"
 
-        # Action buttons
-        btn_frame = ctk.CTkFrame(row, fg_color="transparent", width=120)
-        btn_frame.pack(side="left", padx=5)
+    def _move_selection(self, step: int):
+        """Move the selection through the full list, scrolling as needed."""
+        if not self._all_materials:
+            return "break"
 
-        edit_btn = ctk.CTkButton(
-            btn_frame,
-            text="Edit",
-            width=50,
-            height=24,
-            command=lambda m=material: self._edit_material(m)
+        index = -1
+        if self.selected_material:
+            index = next((i for i, m in enumerate(self._all_materials)
+                          if m.id == self.selected_material.id), -1)
+        index = max(0, min(index + step, len(self._all_materials) - 1))
+
+        visible = self._visible_row_count()
+        if index < self._first:
+            self._first = index
+        elif index >= self._first + visible:
+            self._first = index - visible + 1
+
+        self.selected_material = self._all_materials[index]
+        self.tree.selection_remove(*self.tree.selection())
+        self._reflow()
+        self.tree.focus(str(self.selected_material.id))
+        return "break"
+
+    def refresh(self):
+        """Reload categories and materials, keeping the current filter."""
+        self._invalidate_index()
+        self._refresh_categories()
+        self._filter_materials()
+
+    @staticmethod
+    def _row_values(material: Material) -> tuple:
+        """Format a material as Treeview column values."""
+        return (
+            material.category,
+            material.name[:35],
+            material.unit,
+            f"${material.cost:.2f}",
+            f"{(material.markup - 1) * 100:.0f}%",
+            material.supplier[:12] if material.supplier else "-"
         )
-        edit_btn.pack(side="left", padx=2)
 
-        del_btn = ctk.CTkButton(
-            btn_frame,
-            text="Del",
-            width=50,
-            height=24,
-            fg_color="red",
-            hover_color="darkred",
-            command=lambda m=material: self._delete_material(m)
+    def _apply_tree_style(self, mode: str = None):
+        """Theme the Treeview to match the current CTk appearance mode."""
+        mode_index = 1 if (mode or ctk.get_appearance_mode()) == "Dark" else 0
+        theme = ctk.ThemeManager.theme
+        background = theme["CTkFrame"]["top_fg_color"][mode_index]
+        text_color = theme["CTkLabel"]["text_color"][mode_index]
+
+        style = ttk.Style(self)
+        style.configure(
+            "PriceList.Treeview",
+            background=background,
+            fieldbackground=background,
+            foreground=text_color,
+            borderwidth=0,
+            rowheight=self.ROW_HEIGHT
+        )
+        style.configure(
+            "PriceList.Treeview.Heading",
+            background=("gray85", "gray25")[mode_index],
+            foreground=text_color,
+            font=get_font(weight="bold"),
+            relief="flat"
         )
-        del_btn.pack(side="left", padx=2)
+        style.map(
+            "PriceList.Treeview",
+            background=[("selected", theme["CTkButton"]["fg_color"][mode_index])],
+            foreground=[("selected", "white")]
+        )
+
+    def _on_tree_select(self, event):
+        """Track the selected material."""
+        # Rows leaving the virtual window drop out of the Treeview selection,
+        # so only a real selection replaces the tracked material.
+        selection = self.tree.selection()
+        if selection:
+            self.selected_material = self._materials_by_id.get(selection[0])
+
+    def _edit_selected(self):
+        """Edit the selected material."""
+        if not self.selected_material:
+            messagebox.showwarning("No Selection", "Select a material to edit")
+            return
+        self._edit_material(self.selected_material)
+
+    def _delete_selected(self):
+        """Delete the selected material."""
+        if not self.selected_material:
+            messagebox.showwarning("No Selection", "Select a material to delete")
+            return
+        self._delete_material(self.selected_material)
+
+    def _get_index(self) -> list:
+        """Return the cached filter index, loading materials if needed."""
+        if self._index is None:
+            self._index = [(m.name.lower(), m.category, m) for m in Material.get_all()]
+            self._categories = {category for _, category, _ in self._index}
+        return self._index
+
+    def _sorted_categories(self) -> list:
+        """Return known categories from the cached index, without a DB query."""
+        self._get_index()
+        return sorted(self._categories)
+
+    def _invalidate_index(self):
+        """Drop the cached materials after they change in the database."""
+        self._index = None
+
+    def _schedule_filter(self):
+        """Debounce search so only the last keystroke in a burst filters."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.SEARCH_DELAY_MS, self._filter_materials)
 
     def _filter_materials(self, *args):
         """Filter materials by category and search."""
+        self._search_after_id = None
         category = self.category_var.get()
-        search = self.search_var.get().strip()
-
-        if category == "All":
-            if search:
-                materials = Material.search(search)
-            else:
-                materials = Material.get_all()
-        else:
-            materials = Material.get_by_category(category)
-            if search:
-                search_lower = search.lower()
-                materials = [m for m in materials if search_lower in m.name.lower()]
-
+        search_lower = self.search_var.get().strip().lower()
+
+        # A linear scan over the pre-lowered names is fast enough for any price
+        # list, and unlike a built index it costs nothing after each edit
+        materials = [
+            m for name_lower, c, m in self._get_index()
+            if (category == "All" or c == category)
+            and (not search_lower or search_lower in name_lower)
+        ]
         self._load_materials(materials)
 
+    def destroy(self):
+        """Stop following appearance mode changes before tearing down the view."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        ctk.AppearanceModeTracker.remove(self._apply_tree_style)
+        super().destroy()
+
     def _add_material(self):
         """Add a new material."""
-        dialog = MaterialEditDialog(self)
+        dialog = MaterialEditDialog(self, categories=self._sorted_categories())
         self.wait_window(dialog)
 
         if dialog.result:
+            self._invalidate_index()
             self._refresh_categories()
-            self._load_materials()
+            self._filter_materials()
 
     def _edit_material(self, material: Material):
         """Edit a material."""
-        dialog = MaterialEditDialog(self, material=material)
+        dialog = MaterialEditDialog(self, material=material, categories=self._sorted_categories())
         self.wait_window(dialog)
 
         if dialog.result:
-            self._load_materials()
+            self._invalidate_index()
+            self._filter_materials()
 
     def _delete_material(self, material: Material):
         """Delete a material."""
         if messagebox.askyesno("Confirm Delete", f"Delete '{material.name}'?"):
             material.delete()
-            self._load_materials()
+            self._invalidate_index()
+            self._filter_materials()
 
     def _refresh_categories(self):
         """Refresh category filter options."""
-        categories = ["All"] + Material.get_categories()
+        categories = ["All"] + self._sorted_categories()
+        # Reconfiguring rebuilds the dropdown menu, so skip it when unchanged
+        if categories == self._last_category_values:
+            return
         self.category_filter.configure(values=categories)
+        self._last_category_values = categories
 
     def _import_csv(self):
         """Import materials from CSV."""
@@ -293,14 +527,34 @@ class PriceListManager(ctk.CTkFrame):
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
 
-        if file_path:
-            try:
-                count = Material.import_from_csv(file_path)
-                messagebox.showinfo("Import Complete", f"Imported {count} materials.")
-                self._refresh_categories()
-                self._load_materials()
-            except Exception as e:
-                messagebox.showerror("Import Error", str(e))
+        if not file_path:
+            return
+
+        dialog = ProgressDialog(self, "Importing Price List", "Importing materials...")
+        future = executor.submit(self._import_worker, file_path, dialog)
+        dispatch.when_done(dialog, future, self._on_import_done, dialog)
+
+    def _import_worker(self, file_path: str, dialog: 'ProgressDialog') -> int:
+        """Stream a CSV into the database, reporting progress to the dialog."""
+        done = 0
+        for done, total in Material.iter_import_from_csv(file_path, chunk_size=1000):
+            dispatch.post(dialog, dialog.set_progress, done / total)
+        return done
+
+    def _on_import_done(self, dialog: 'ProgressDialog', future):
+        """Close the progress dialog and reload the imported materials."""
+        dialog.destroy()
+
+        try:
+            count = future.result()
+        except Exception as e:
+            messagebox.showerror("Import Error", str(e))
+            return
+
+        self._invalidate_index()
+        self._refresh_categories()
+        self._filter_materials()
+        messagebox.showinfo("Import Complete", f"Imported {count} materials.")
 
     def _export_csv(self):
         """Export materials to CSV."""
@@ -310,12 +564,25 @@ class PriceListManager(ctk.CTkFrame):
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
 
-        if file_path:
-            try:
-                Material.export_to_csv(file_path)
-                messagebox.showinfo("Export Complete", f"Price list exported to:\n{file_path}")
-            except Exception as e:
-                messagebox.showerror("Export Error", str(e))
+        if not file_path:
+            return
+
+        dialog = ProgressDialog(self, "Export Price List", "Exporting materials...")
+        future = executor.submit(self._export_worker, file_path, dialog)
+        dispatch.when_done(dialog, future, self._on_export_done, file_path, dialog)
+
+    def _export_worker(self, file_path: str, dialog: 'ProgressDialog'):
+        """Stream materials to a CSV file, reporting progress to the dialog."""
+        for done, total in Material.iter_export_to_csv(file_path, batch=1000):
+            dispatch.post(dialog, dialog.set_progress, done / total)
+
+    def _on_export_done(self, file_path: str, dialog: 'ProgressDialog', future):
+        """Close the progress dialog and report the export result."""
+        dialog.destroy()
+        if future.exception() is not None:
+            messagebox.showerror("Export Error", str(future.exception()))
+            return
+        messagebox.showinfo("Export Complete", f"Price list exported to:\n{file_path}")
 
     def _check_price_url(self):
         """Check price from entered URL."""
@@ -336,17 +603,20 @@ class PriceListManager(ctk.CTkFrame):
         loading.pack()
 
         # Fetch price in background
-        self.after(100, lambda: self._fetch_price(url))
+        self._price_url = url
+        future = executor.submit(get_supplier_api().get_price_from_url, url)
+        dispatch.when_done(self, future, self._on_price_fetched, url)
 
-    def _fetch_price(self, url: str):
-        """Fetch price from URL."""
-        api = get_supplier_api()
-        result = api.get_price_from_url(url)
+    def _on_price_fetched(self, url: str, future):
+        """Show a finished price check unless a newer one replaced it."""
+        if url != self._price_url:
+            return
 
         # Clear loading
         for widget in self.price_result_frame.winfo_children():
             widget.destroy()
 
+        result = future.result() if future.exception() is None else None
         if result:
             self._show_price_result(result)
         else:
@@ -368,7 +638,7 @@ class PriceListManager(ctk.CTkFrame):
         ctk.CTkLabel(
             info_frame,
             text=result.product_name,
-            font=ctk.CTkFont(weight="bold"),
+            font=get_font(weight="bold"),
             anchor="w"
         ).pack(anchor="w")
 
@@ -398,38 +668,66 @@ class PriceListManager(ctk.CTkFrame):
             supplier_url=result.url
         )
 
-        dialog = MaterialEditDialog(self, material=material)
+        dialog = MaterialEditDialog(self, material=material, categories=self._sorted_categories())
         self.wait_window(dialog)
 
         if dialog.result:
+            get_supplier_api().invalidate(result.url)
+            self._invalidate_index()
             self._refresh_categories()
-            self._load_materials()
+            self._filter_materials()
+
+    def _get_search_term(self) -> Optional[str]:
+        """Use the selected material name, or prompt for a search term."""
+        if self.selected_material and self.selected_material.name:
+            return self.selected_material.name
+
+        dialog = ctk.CTkInputDialog(
+            text="Enter product to search:",
+            title="Supplier Search"
+        )
+        return dialog.get_input()
 
     def _open_supplier_search(self, url_template: str):
         """Open supplier search in browser."""
-        # Use selected material name or prompt
-        search_term = ""
-        if self.selected_material:
-            search_term = self.selected_material.name
+        search_term = self._get_search_term()
+        if search_term:
+            webbrowser.open(url_template.format(query=quote_plus(search_term)))
 
-        if not search_term:
-            dialog = ctk.CTkInputDialog(
-                text="Enter product to search:",
-                title="Supplier Search"
-            )
-            search_term = dialog.get_input()
 
-        if search_term:
-            url = url_template.format(query=search_term.replace(' ', '+'))
-            webbrowser.open(url)
+class ProgressDialog(ctk.CTkToplevel):
+    """Modal progress bar for long-running background work."""
+
+    def __init__(self, parent, title: str, message: str):
+        super().__init__(parent)
+        self.title(title)
+        self.geometry("350x120")
+        self.resizable(False, False)
+        # Closing early would orphan the worker; the dialog closes itself when done
+        self.protocol("WM_DELETE_WINDOW", lambda: None)
+
+        ctk.CTkLabel(self, text=message).pack(padx=20, pady=(20, 10))
+
+        self.progress = ctk.CTkProgressBar(self, width=300)
+        self.progress.set(0)
+        self.progress.pack(padx=20, pady=(0, 20))
+
+        self.transient(parent)
+        self.after(1, self.grab_set)
+
+    def set_progress(self, fraction: float):
+        """Update the progress bar (0.0 - 1.0)."""
+        if self.winfo_exists():
+            self.progress.set(fraction)
 
 
 class MaterialEditDialog(ctk.CTkToplevel):
     """Dialog for editing a material."""
 
-    def __init__(self, parent, material: Material = None):
+    def __init__(self, parent, material: Material = None, categories: Optional[list] = None):
         super().__init__(parent)
         self.material = material or Material()
+        self._categories = categories
         self.result: Optional[Material] = None
 
         self.title("Edit Material" if material and material.id else "New Material")
@@ -451,7 +749,9 @@ class MaterialEditDialog(ctk.CTkToplevel):
         row1.pack(fill="x", pady=5)
 
         ctk.CTkLabel(row1, text="Category:", width=80).pack(side="left")
-        categories = Material.get_categories() or ["gates", "operators", "hardware", "access_control", "electrical", "misc"]
+        if self._categories is None:
+            self._categories = Material.get_categories()
+        categories = self._categories or ["gates", "operators", "hardware", "access_control", "electrical", "misc"]
         self.category_var = ctk.StringVar(value=self.material.category or "misc")
         self.category = ctk.CTkComboBox(
             row1,
@@ -479,12 +779,17 @@ class MaterialEditDialog(ctk.CTkToplevel):
         self.unit_entry.insert(0, self.material.unit or "each")
         self.unit_entry.pack(side="left")
 
+        # Cost and markup only accept unsigned decimals as they are typed
+        decimal_vcmd = (self.register(self._is_decimal), "%P")
+
         # Cost
         row4 = ctk.CTkFrame(frame, fg_color="transparent")
         row4.pack(fill="x", pady=5)
 
         ctk.CTkLabel(row4, text="Cost $:", width=80).pack(side="left")
-        self.cost_entry = ctk.CTkEntry(row4, width=100)
+        self.cost_entry = ctk.CTkEntry(
+            row4, width=100, validate="key", validatecommand=decimal_vcmd
+        )
         self.cost_entry.insert(0, f"{self.material.cost:.2f}")
         self.cost_entry.pack(side="left")
 
@@ -493,7 +798,9 @@ class MaterialEditDialog(ctk.CTkToplevel):
         row5.pack(fill="x", pady=5)
 
         ctk.CTkLabel(row5, text="Markup %:", width=80).pack(side="left")
-        self.markup_entry = ctk.CTkEntry(row5, width=100)
+        self.markup_entry = ctk.CTkEntry(
+            row5, width=100, validate="key", validatecommand=decimal_vcmd
+        )
         markup_percent = (self.material.markup - 1) * 100
         self.markup_entry.insert(0, f"{markup_percent:.0f}")
         self.markup_entry.pack(side="left")
@@ -533,6 +840,16 @@ class MaterialEditDialog(ctk.CTkToplevel):
             command=self._save
         ).pack(side="right")
 
+    @staticmethod
+    def _is_decimal(text: str) -> bool:
+        """Allow empty text or an unsigned number with at most one decimal point."""
+        return text in ("", ".") or text.replace(".", "", 1).isdigit()
+
+    @staticmethod
+    def _parse_decimal(text: str) -> float:
+        """Parse validated entry text, treating blank as zero."""
+        return float(text) if text.strip(".") else 0.0
+
     def _save(self):
         """Save the material."""
         name = self.name_entry.get().strip()
@@ -540,13 +857,8 @@ class MaterialEditDialog(ctk.CTkToplevel):
             messagebox.showerror("Error", "Name is required")
             return
 
-        try:
-            cost = float(self.cost_entry.get())
-            markup_percent = float(self.markup_entry.get())
-            markup = 1 + (markup_percent / 100)
-        except ValueError:
-            messagebox.showerror("Error", "Invalid cost or markup")
-            return
+        cost = self._parse_decimal(self.cost_entry.get())
+        markup = 1 + (self._parse_decimal(self.markup_entry.get()) / 100)
 
         self.material.category = self.category_var.get()
         self.material.name = name
@@ -1,36 +1,101 @@
 """Quote creation and editing form for Gate Quote Pro."""
+import copy
 import customtkinter as ctk
 from tkinter import messagebox
-import subprocess
-from typing import Optional, List
+from bisect import insort
+from functools import partial
+from typing import Dict, Optional, List, Tuple
 
+from . import dispatch
+from .fonts import get_font
 from ..models.quote import Quote, QuoteItem
 from ..models.customer import Customer
 from ..models.materials import Material
 from ..models.database import get_db
 from ..services.quote_calculator import get_calculator
-from ..services.pdf_generator import get_pdf_generator
+from ..services._executor import executor
+from ..utils.system import open_file
+
+
+CUSTOMER_PLACEHOLDER = "-- Select Customer --"
+
+# Customer combobox values (placeholder first) and name lookup, shared by every form
+_customer_cache = {'names': None, 'map': None}
+
+
+def _get_customers() -> Tuple[List[str], Dict[str, Customer]]:
+    """Get the customer combobox values and name lookup, loading them once."""
+    if _customer_cache['names'] is None:
+        customers = Customer.get_all()
+        _customer_cache['names'] = [CUSTOMER_PLACEHOLDER] + [c.name for c in customers]
+        _customer_cache['map'] = {c.name: c for c in customers}
+    return _customer_cache['names'], _customer_cache['map']
+
+
+def _add_cached_customer(customer: Customer):
+    """Add a newly saved customer to the cache, keeping names sorted."""
+    if _customer_cache['names'] is None:
+        return
+    insort(_customer_cache['names'], customer.name, lo=1)
+    _customer_cache['map'][customer.name] = customer
+
+
+def invalidate_customer_cache():
+    """Forget cached customers after one is edited or deleted elsewhere."""
+    _customer_cache['names'] = None
+    _customer_cache['map'] = None
 
 
 class QuoteForm(ctk.CTkFrame):
     """Form for creating and editing quotes."""
 
-    GATE_TYPES = ["swing", "sliding", "cantilever", "bi-fold", "pedestrian"]
-    GATE_STYLES = ["basic", "standard", "ornamental", "custom"]
-    MATERIALS = ["steel", "aluminum", "wrought_iron", "wood", "chain_link"]
-    AUTOMATION = ["none", "single_swing", "dual_swing", "slide"]
-    ACCESS_CONTROL = ["none", "keypad", "remote", "intercom", "full_system"]
-    GROUND_TYPES = ["concrete", "asphalt", "gravel", "dirt"]
-    SLOPES = ["flat", "slight", "moderate", "steep"]
+    # Option tuples are shared by every form; CTkComboBox keeps a reference
+    # rather than copying, so they are immutable to stay safe to share.
+    GATE_TYPES = ("swing", "sliding", "cantilever", "bi-fold", "pedestrian")
+    GATE_STYLES = ("basic", "standard", "ornamental", "custom")
+    MATERIALS = ("steel", "aluminum", "wrought_iron", "wood", "chain_link")
+    AUTOMATION = ("none", "single_swing", "dual_swing", "slide")
+    ACCESS_CONTROL = ("none", "keypad", "remote", "intercom", "full_system")
+    GROUND_TYPES = ("concrete", "asphalt", "gravel", "dirt")
+    SLOPES = ("flat", "slight", "moderate", "steep")
+
+    SUMMARY_DELAY_MS = 150
+
+    # Line items are drawn as one fixed-width label per row
+    ITEM_FONT_FAMILY = "Courier"
+    ITEM_HEADER = f"{'Description':<30} {'Qty':>6} {'Unit':<6} {'Cost':>9} {'Total':>10}"
+
+    # (form variable, quote attribute, fallback if invalid; None keeps the old value)
+    FLOAT_FIELDS = (
+        ("width_var", "width", 12.0),
+        ("height_var", "height", 6.0),
+        ("power_var", "power_distance", 0.0),
+        ("labor_hours_var", "labor_hours", None),
+        ("labor_rate_var", "labor_rate", None),
+    )
+
+    # Quote attributes the calculator fills in from settings and specifications
+    CALCULATED_FIELDS = ("labor_rate", "markup_percent", "tax_rate", "labor_hours")
 
     def __init__(self, parent, quote: Quote = None, main_window=None):
         super().__init__(parent, fg_color="transparent")
         self.main_window = main_window
         self.quote = quote or Quote()
         self.items: List[QuoteItem] = list(self.quote.items) if self.quote.items else []
+        # Kept in step with self.items so the summary needn't re-sum them
+        self._materials_total = sum(item.total_cost for item in self.items)
+
+        # Display refreshes are coalesced into one idle callback each
+        self._summary_pending = False
+        self._customer_info_pending = False
+        self._pending_customer: Optional[Customer] = None
+        self._last_labels = {}
+        self._summary_ready = False
+        self._summary_after_id = None
+        # Set whenever a form variable changes; cleared once copied to the quote
+        self._form_dirty = True
 
         self._create_layout()
-        self._populate_form()
 
     def _create_layout(self):
         """Create the form layout."""
@@ -46,7 +111,7 @@ class QuoteForm(ctk.CTkFrame):
         title = ctk.CTkLabel(
             header,
             text=title_text,
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title.pack(side="left")
 
@@ -58,6 +123,7 @@ class QuoteForm(ctk.CTkFrame):
             btn_frame,
             text="Calculate",
             command=self._calculate_quote,
+            state="disabled",
             fg_color="#3182ce",
             hover_color="#2c5282"
         )
@@ -67,6 +133,7 @@ class QuoteForm(ctk.CTkFrame):
             btn_frame,
             text="Save Quote",
             command=self._save_quote,
+            state="disabled",
             fg_color="#38a169",
             hover_color="#2f855a"
         )
@@ -76,6 +143,7 @@ class QuoteForm(ctk.CTkFrame):
             btn_frame,
             text="Generate PDF",
             command=self._generate_pdf,
+            state="disabled",
             fg_color="#805ad5",
             hover_color="#6b46c1"
         )
@@ -94,24 +162,53 @@ class QuoteForm(ctk.CTkFrame):
         # Customer Section
         self._create_customer_section(left_col)
 
-        # Gate Specifications Section
-        self._create_gate_section(left_col)
+        # The remaining sections are built one per event-loop turn so the
+        # form paints as soon as the header and customer section exist.
+        self._pending_sections = [
+            lambda: self._create_gate_section(left_col),
+            lambda: self._create_site_section(left_col),
+            lambda: self._create_materials_section(right_col),
+            lambda: self._create_summary_section(right_col),
+            self._finish_layout,
+        ]
+        self.after_idle(self._build_next_section)
+
+    def _build_next_section(self):
+        """Build the next deferred section, then schedule the one after."""
+        if not self.winfo_exists():
+            return
+
+        self._pending_sections.pop(0)()
+        if self._pending_sections:
+            self.after(1, self._build_next_section)
 
-        # Site Conditions Section
-        self._create_site_section(left_col)
+    def _finish_layout(self):
+        """Enable the actions and fill in the form once every section exists."""
+        self._summary_ready = True
+        for btn in (self.calculate_btn, self.save_btn, self.pdf_btn):
+            btn.configure(state="normal")
 
-        # Materials Section
-        self._create_materials_section(right_col)
+        # Fill the form before tracing so the initial values don't fire traces
+        self._populate_form()
+
+        for var in (
+            self.gate_type_var, self.gate_style_var, self.material_var,
+            self.automation_var, self.access_var, self.ground_var, self.slope_var,
+            self.removal_var, self.width_var, self.height_var, self.power_var,
+            self.labor_hours_var, self.labor_rate_var
+        ):
+            var.trace_add("write", self._mark_dirty)
 
-        # Summary Section
-        self._create_summary_section(right_col)
+    def _mark_dirty(self, *args):
+        """Note that form values changed since they were last read."""
+        self._form_dirty = True
 
     def _create_section_header(self, parent, title: str):
         """Create a section header."""
         header = ctk.CTkLabel(
             parent,
             text=title,
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         header.pack(anchor="w", pady=(15, 10))
 
@@ -129,11 +226,9 @@ class QuoteForm(ctk.CTkFrame):
         select_frame = ctk.CTkFrame(content, fg_color="transparent")
         select_frame.pack(fill="x", pady=5)
 
-        customers = Customer.get_all()
-        customer_names = ["-- Select Customer --"] + [c.name for c in customers]
-        self.customer_map = {c.name: c for c in customers}
+        customer_names, self.customer_map = _get_customers()
 
-        self.customer_var = ctk.StringVar(value="-- Select Customer --")
+        self.customer_var = ctk.StringVar(value=CUSTOMER_PLACEHOLDER)
         self.customer_select = ctk.CTkComboBox(
             select_frame,
             values=customer_names,
@@ -203,12 +298,12 @@ class QuoteForm(ctk.CTkFrame):
         row2.pack(fill="x", pady=5)
 
         ctk.CTkLabel(row2, text="Width (ft):", width=100).pack(side="left")
-        self.width_var = ctk.StringVar(value=str(self.quote.width))
+        self.width_var = ctk.StringVar(value="")
         self.width_entry = ctk.CTkEntry(row2, textvariable=self.width_var, width=80)
         self.width_entry.pack(side="left", padx=(0, 20))
 
         ctk.CTkLabel(row2, text="Height (ft):", width=80).pack(side="left")
-        self.height_var = ctk.StringVar(value=str(self.quote.height))
+        self.height_var = ctk.StringVar(value="")
         self.height_entry = ctk.CTkEntry(row2, textvariable=self.height_var, width=80)
         self.height_entry.pack(side="left")
 
@@ -292,7 +387,7 @@ class QuoteForm(ctk.CTkFrame):
         row2.pack(fill="x", pady=5)
 
         ctk.CTkLabel(row2, text="Power Dist (ft):", width=100).pack(side="left")
-        self.power_var = ctk.StringVar(value=str(self.quote.power_distance))
+        self.power_var = ctk.StringVar(value="")
         self.power_entry = ctk.CTkEntry(row2, textvariable=self.power_var, width=80)
         self.power_entry.pack(side="left")
 
@@ -319,7 +414,7 @@ class QuoteForm(ctk.CTkFrame):
         ctk.CTkLabel(
             header,
             text="Materials & Equipment",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(side="left")
 
         add_btn = ctk.CTkButton(
@@ -331,7 +426,7 @@ class QuoteForm(ctk.CTkFrame):
         )
         add_btn.pack(side="right")
 
-        suggest_btn = ctk.CTkButton(
+        self.suggest_btn = ctk.CTkButton(
             header,
             text="Auto-Suggest",
             width=100,
@@ -339,56 +434,85 @@ class QuoteForm(ctk.CTkFrame):
             fg_color="gray50",
             command=self._suggest_materials
         )
-        suggest_btn.pack(side="right", padx=5)
+        self.suggest_btn.pack(side="right", padx=5)
 
         # Items list
         self.items_frame = ctk.CTkScrollableFrame(section, height=200)
         self.items_frame.pack(fill="x", padx=15, pady=10)
 
+        self._row_widgets = []
+        self._last_items_sig = None
+        self._items_header = None
+        self._items_empty = None
+
         self._refresh_items_list()
 
+    def _items_signature(self) -> tuple:
+        """Identify the current items cheaply for change detection."""
+        return tuple((id(item), item.total_cost) for item in self.items)
+
     def _refresh_items_list(self):
         """Refresh the materials list display."""
-        for widget in self.items_frame.winfo_children():
-            widget.destroy()
+        self._last_items_sig = self._items_signature()
 
+        # Rows are pooled: existing rows are updated in place, new ones are
+        # only built when the list grows, and surplus rows are hidden.
         if not self.items:
-            empty = ctk.CTkLabel(
-                self.items_frame,
-                text="No items added. Click 'Auto-Suggest' or 'Add Item'.",
-                text_color="gray50"
-            )
-            empty.pack(pady=20)
+            if self._items_header is not None:
+                self._items_header.pack_forget()
+            for row in self._row_widgets:
+                row['row'].pack_forget()
+
+            if self._items_empty is None:
+                self._items_empty = ctk.CTkLabel(
+                    self.items_frame,
+                    text="No items added. Click 'Auto-Suggest' or 'Add Item'.",
+                    text_color="gray50"
+                )
+            if not self._items_empty.winfo_manager():
+                self._items_empty.pack(pady=20)
             return
 
+        if self._items_empty is not None:
+            self._items_empty.pack_forget()
+
         # Header row
-        header = ctk.CTkFrame(self.items_frame, fg_color="transparent")
-        header.pack(fill="x", pady=(0, 5))
-
-        headers = [("Description", 200), ("Qty", 50), ("Unit", 50), ("Cost", 70), ("Total", 80), ("", 30)]
-        for text, width in headers:
-            ctk.CTkLabel(
-                header,
-                text=text,
-                width=width,
-                font=ctk.CTkFont(size=11, weight="bold")
-            ).pack(side="left", padx=2)
+        if self._items_header is None:
+            self._items_header = ctk.CTkLabel(
+                self.items_frame,
+                text=self.ITEM_HEADER,
+                anchor="w",
+                font=get_font(12, "bold", self.ITEM_FONT_FAMILY)
+            )
+        if not self._items_header.winfo_manager():
+            self._items_header.pack(fill="x", padx=2, pady=(0, 5))
 
         # Item rows
         for i, item in enumerate(self.items):
-            self._create_item_row(i, item)
-
-    def _create_item_row(self, index: int, item: QuoteItem):
-        """Create a row for a line item."""
+            if i == len(self._row_widgets):
+                self._row_widgets.append(self._create_item_row(i))
+            row = self._row_widgets[i]
+            self._update_item_row(row, item)
+            if not row['row'].winfo_manager():
+                row['row'].pack(fill="x", pady=2)
+
+        for row in self._row_widgets[len(self.items):]:
+            row['row'].pack_forget()
+
+    def _create_item_row(self, index: int) -> dict:
+        """Create a pooled row for the line item at index."""
         row = ctk.CTkFrame(self.items_frame, fg_color="transparent")
-        row.pack(fill="x", pady=2)
 
-        ctk.CTkLabel(row, text=item.description[:30], width=200, anchor="w").pack(side="left", padx=2)
-        ctk.CTkLabel(row, text=f"{item.quantity:.1f}", width=50).pack(side="left", padx=2)
-        ctk.CTkLabel(row, text=item.unit, width=50).pack(side="left", padx=2)
-        ctk.CTkLabel(row, text=f"${item.unit_cost:.2f}", width=70).pack(side="left", padx=2)
-        ctk.CTkLabel(row, text=f"${item.total_cost:.2f}", width=80).pack(side="left", padx=2)
+        label = ctk.CTkLabel(
+            row,
+            text="",
+            anchor="w",
+            font=get_font(12, family=self.ITEM_FONT_FAMILY)
+        )
+        label.pack(side="left", padx=2)
+        widgets = {'row': row, 'label': label, 'text': None}
 
+        # A pooled row always shows the same index, so its command never changes
         del_btn = ctk.CTkButton(
             row,
             text="X",
@@ -396,9 +520,22 @@ class QuoteForm(ctk.CTkFrame):
             height=24,
             fg_color="red",
             hover_color="darkred",
-            command=lambda idx=index: self._remove_item(idx)
+            command=partial(self._remove_item, index)
         )
         del_btn.pack(side="left", padx=2)
+        widgets['del'] = del_btn
+
+        return widgets
+
+    def _update_item_row(self, row: dict, item: QuoteItem):
+        """Show a line item in a pooled row, configuring it only on change."""
+        text = (
+            f"{item.description[:30]:<30} {item.quantity:>6.1f} {item.unit[:6]:<6} "
+            f"${item.unit_cost:>8.2f} ${item.total_cost:>9.2f}"
+        )
+        if row['text'] != text:
+            row['label'].configure(text=text)
+            row['text'] = text
 
     def _create_summary_section(self, parent):
         """Create quote summary section."""
@@ -415,16 +552,21 @@ class QuoteForm(ctk.CTkFrame):
         labor_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(labor_frame, text="Labor Hours:", width=120).pack(side="left")
-        self.labor_hours_var = ctk.StringVar(value=str(self.quote.labor_hours))
+        self.labor_hours_var = ctk.StringVar(value="")
         self.labor_hours = ctk.CTkEntry(labor_frame, textvariable=self.labor_hours_var, width=80)
         self.labor_hours.pack(side="left")
 
         ctk.CTkLabel(labor_frame, text="@ $", width=30).pack(side="left", padx=(10, 0))
-        self.labor_rate_var = ctk.StringVar(value=str(self.quote.labor_rate))
+        self.labor_rate_var = ctk.StringVar(value="")
         self.labor_rate = ctk.CTkEntry(labor_frame, textvariable=self.labor_rate_var, width=80)
         self.labor_rate.pack(side="left")
         ctk.CTkLabel(labor_frame, text="/hr").pack(side="left")
 
+        # Keep totals live while labor is edited, debounced to limit redraws
+        for entry in (self.labor_hours, self.labor_rate):
+            for sequence in ("<KeyRelease>", "<FocusOut>", "<Return>"):
+                entry.bind(sequence, self._schedule_summary)
+
         # Totals
         totals_frame = ctk.CTkFrame(content)
         totals_frame.pack(fill="x", pady=10)
@@ -441,7 +583,7 @@ class QuoteForm(ctk.CTkFrame):
         self.total_label = ctk.CTkLabel(
             totals_frame,
             text="TOTAL: $0.00",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         self.total_label.pack(anchor="e", padx=15, pady=5)
 
@@ -457,6 +599,10 @@ class QuoteForm(ctk.CTkFrame):
 
     def _populate_form(self):
         """Populate form with existing quote data."""
+        # Numeric fields start empty and are formatted once here
+        for var_name, attr, _ in self.FLOAT_FIELDS:
+            getattr(self, var_name).set(str(getattr(self.quote, attr)))
+
         if self.quote.customer:
             self.customer_var.set(self.quote.customer.name)
             self._update_customer_info(self.quote.customer)
@@ -473,21 +619,40 @@ class QuoteForm(ctk.CTkFrame):
         else:
             self.quote.customer_id = None
             self.quote.customer = None
-            self.customer_info.configure(text="")
-
-    def _update_customer_info(self, customer: Customer):
+            self._update_customer_info(None)
+
+    def _set_label_text(self, label: ctk.CTkLabel, text: str):
+        """Configure a label only if its text actually changed."""
+        if self._last_labels.get(label) != text:
+            label.configure(text=text)
+            self._last_labels[label] = text
+
+    def _update_customer_info(self, customer: Optional[Customer]):
+        """Schedule a customer info refresh on the next idle."""
+        self._pending_customer = customer
+        if not self._customer_info_pending:
+            self._customer_info_pending = True
+            self.after_idle(self._do_update_customer_info)
+
+    def _do_update_customer_info(self):
         """Update customer info display."""
-        info_parts = []
-        if customer.address:
-            info_parts.append(customer.address)
-        if customer.city or customer.state:
-            info_parts.append(f"{customer.city}, {customer.state} {customer.zip_code}".strip())
-        if customer.phone:
-            info_parts.append(f"Phone: {customer.phone}")
-        if customer.email:
-            info_parts.append(f"Email: {customer.email}")
+        self._customer_info_pending = False
+        if not self.winfo_exists():
+            return
 
-        self.customer_info.configure(text="\n".join(info_parts))
+        customer = self._pending_customer
+        info_parts = []
+        if customer is not None:
+            if customer.address:
+                info_parts.append(customer.address)
+            if customer.city or customer.state:
+                info_parts.append(f"{customer.city}, {customer.state} {customer.zip_code}".strip())
+            if customer.phone:
+                info_parts.append(f"Phone: {customer.phone}")
+            if customer.email:
+                info_parts.append(f"Email: {customer.email}")
+
+        self._set_label_text(self.customer_info, "\n".join(info_parts))
 
     def _new_customer_dialog(self):
         """Show dialog to create new customer."""
@@ -496,9 +661,7 @@ class QuoteForm(ctk.CTkFrame):
 
         if dialog.result:
             # Refresh customer list
-            customers = Customer.get_all()
-            customer_names = ["-- Select Customer --"] + [c.name for c in customers]
-            self.customer_map = {c.name: c for c in customers}
+            customer_names, self.customer_map = _get_customers()
             self.customer_select.configure(values=customer_names)
             self.customer_var.set(dialog.result.name)
             self._on_customer_select(dialog.result.name)
@@ -510,17 +673,36 @@ class QuoteForm(ctk.CTkFrame):
 
         if dialog.result:
             self.items.append(dialog.result)
+            self._materials_total += dialog.result.total_cost
             self._refresh_items_list()
             self._update_summary()
 
+    def _set_calculating(self, busy: bool):
+        """Disable actions that touch the quote while the calculator runs."""
+        state = "disabled" if busy else "normal"
+        for btn in (self.calculate_btn, self.save_btn, self.suggest_btn):
+            btn.configure(state=state)
+
     def _suggest_materials(self):
         """Auto-suggest materials based on specifications."""
         self._update_quote_from_form()
-        calculator = get_calculator()
-        suggested = calculator.suggest_materials(self.quote)
+        self._set_calculating(True)
+        # The worker gets a snapshot so UI edits can't race with it
+        future = executor.submit(get_calculator().suggest_materials, copy.deepcopy(self.quote))
+        dispatch.when_done(self, future, self._on_materials_suggested)
+
+    def _on_materials_suggested(self, future):
+        """Show suggested materials once the calculator finishes."""
+        self._set_calculating(False)
 
+        if future.exception() is not None:
+            messagebox.showerror("Error", f"Failed to suggest materials: {future.exception()}")
+            return
+
+        suggested = future.result()
         if suggested:
             self.items = suggested
+            self._materials_total = sum(item.total_cost for item in self.items)
             self._refresh_items_list()
             self._update_summary()
             messagebox.showinfo("Materials Suggested", f"Added {len(suggested)} suggested items based on specifications.")
@@ -530,66 +712,97 @@ class QuoteForm(ctk.CTkFrame):
     def _remove_item(self, index: int):
         """Remove an item from the list."""
         if 0 <= index < len(self.items):
+            self._materials_total -= self.items[index].total_cost
             del self.items[index]
             self._refresh_items_list()
             self._update_summary()
 
     def _update_quote_from_form(self):
         """Update quote object from form values."""
-        self.quote.gate_type = self.gate_type_var.get()
-        self.quote.gate_style = self.gate_style_var.get()
-        self.quote.material = self.material_var.get()
-        self.quote.automation = self.automation_var.get()
-        self.quote.access_control = self.access_var.get()
-        self.quote.ground_type = self.ground_var.get()
-        self.quote.slope = self.slope_var.get()
-        self.quote.removal_needed = self.removal_var.get()
-
-        try:
-            self.quote.width = float(self.width_var.get())
-        except ValueError:
-            self.quote.width = 12.0
-
-        try:
-            self.quote.height = float(self.height_var.get())
-        except ValueError:
-            self.quote.height = 6.0
-
-        try:
-            self.quote.power_distance = float(self.power_var.get())
-        except ValueError:
-            self.quote.power_distance = 0.0
-
-        try:
-            self.quote.labor_hours = float(self.labor_hours_var.get())
-        except ValueError:
-            pass
-
-        try:
-            self.quote.labor_rate = float(self.labor_rate_var.get())
-        except ValueError:
-            pass
-
+        # Variables are only re-read after one changes (e.g. Save then PDF)
+        if self._form_dirty:
+            self.quote.gate_type = self.gate_type_var.get()
+            self.quote.gate_style = self.gate_style_var.get()
+            self.quote.material = self.material_var.get()
+            self.quote.automation = self.automation_var.get()
+            self.quote.access_control = self.access_var.get()
+            self.quote.ground_type = self.ground_var.get()
+            self.quote.slope = self.slope_var.get()
+            self.quote.removal_needed = self.removal_var.get()
+
+            for var_name, attr, default in self.FLOAT_FIELDS:
+                try:
+                    setattr(self.quote, attr, float(getattr(self, var_name).get()))
+                except ValueError:
+                    if default is not None:
+                        setattr(self.quote, attr, default)
+
+            self._form_dirty = False
+
+        # The notes textbox and item list aren't variables, so always sync them
         self.quote.notes = self.notes_text.get("1.0", "end").strip()
         self.quote.items = self.items
 
     def _calculate_quote(self):
         """Calculate quote totals."""
         self._update_quote_from_form()
-        calculator = get_calculator()
-        self.quote = calculator.calculate_quote(self.quote)
+        self._set_calculating(True)
+        future = executor.submit(get_calculator().calculate_quote, copy.deepcopy(self.quote))
+        dispatch.when_done(self, future, self._on_quote_calculated)
+
+    def _on_quote_calculated(self, future):
+        """Show calculated totals once the calculator finishes."""
+        self._set_calculating(False)
+
+        if future.exception() is not None:
+            messagebox.showerror("Error", f"Failed to calculate quote: {future.exception()}")
+            return
+        result = future.result()
+
+        # Copy the results onto the live quote, keeping items edited meanwhile
+        for attr in self.CALCULATED_FIELDS:
+            setattr(self.quote, attr, getattr(result, attr))
+        if not self.items:
+            self.items = result.items
+        self.quote.items = self.items
+        self.quote.calculate_totals()
 
         # Update form with calculated values
         self.labor_hours_var.set(str(self.quote.labor_hours))
         self.labor_rate_var.set(str(self.quote.labor_rate))
-        self.items = self.quote.items
+        self._materials_total = sum(item.total_cost for item in self.items)
 
-        self._refresh_items_list()
+        # Recalculating often returns the same items; skip the redraw then
+        if self._items_signature() != self._last_items_sig:
+            self._refresh_items_list()
+        self._update_summary()
+
+    def _schedule_summary(self, event=None):
+        """Debounce summary updates so a burst of keystrokes repaints once."""
+        if self._summary_after_id:
+            self.after_cancel(self._summary_after_id)
+        self._summary_after_id = self.after(self.SUMMARY_DELAY_MS, self._run_scheduled_summary)
+
+    def _run_scheduled_summary(self):
+        """Run a debounced summary update."""
+        self._summary_after_id = None
         self._update_summary()
 
     def _update_summary(self):
+        """Schedule a summary refresh, coalescing bursts into one repaint."""
+        if not self._summary_ready:
+            return
+        if not self._summary_pending:
+            self._summary_pending = True
+            self.after_idle(self._do_update_summary)
+
+    def _do_update_summary(self):
         """Update the summary display."""
-        materials_total = sum(item.total_cost for item in self.items)
+        self._summary_pending = False
+        if not self.winfo_exists():
+            return
+
+        materials_total = self._materials_total
 
         try:
             labor_hours = float(self.labor_hours_var.get())
@@ -600,16 +813,15 @@ class QuoteForm(ctk.CTkFrame):
 
         labor_total = labor_hours * labor_rate
 
-        db = get_db()
-        markup = float(db.get_setting('markup_percent', '30'))
+        markup = float(get_db().get_setting('markup_percent', '30'))
         materials_with_markup = materials_total * (1 + markup / 100)
 
         subtotal = materials_with_markup + labor_total
 
-        self.materials_label.configure(text=f"Materials (w/ {markup:.0f}% markup): ${materials_with_markup:.2f}")
-        self.labor_label.configure(text=f"Labor ({labor_hours:.1f} hrs): ${labor_total:.2f}")
-        self.subtotal_label.configure(text=f"Subtotal: ${subtotal:.2f}")
-        self.total_label.configure(text=f"TOTAL: ${subtotal:.2f}")
+        self._set_label_text(self.materials_label, f"Materials (w/ {markup:.0f}% markup): ${materials_with_markup:.2f}")
+        self._set_label_text(self.labor_label, f"Labor ({labor_hours:.1f} hrs): ${labor_total:.2f}")
+        self._set_label_text(self.subtotal_label, f"Subtotal: ${subtotal:.2f}")
+        self._set_label_text(self.total_label, f"TOTAL: ${subtotal:.2f}")
 
     def _save_quote(self):
         """Save the quote to database."""
@@ -631,13 +843,32 @@ class QuoteForm(ctk.CTkFrame):
         if not self.quote.id:
             self.quote.save()
 
+        # Rendering and opening the PDF can take seconds, so do it off the UI thread
+        self.pdf_btn.configure(state="disabled")
+        # Render a snapshot so edits or a recalculation meanwhile can't skew it
+        future = executor.submit(self._pdf_worker, copy.deepcopy(self.quote))
+        dispatch.when_done(self, future, self._on_pdf_generated)
+
+    @staticmethod
+    def _pdf_worker(quote: Quote) -> str:
+        """Write the quote PDF and open it. Runs on a worker thread."""
+        # Imported here so reportlab only loads once a PDF is actually requested
+        from ..services.pdf_generator import get_pdf_generator
+
+        pdf_path = get_pdf_generator().generate(quote)
+        open_file(pdf_path)
+        return pdf_path
+
+    def _on_pdf_generated(self, future):
+        """Re-enable the PDF button and report the result."""
+        self.pdf_btn.configure(state="normal")
+
         try:
-            generator = get_pdf_generator()
-            pdf_path = generator.generate(self.quote)
-            subprocess.run(['open', pdf_path])
-            messagebox.showinfo("PDF Generated", f"Quote saved to:\n{pdf_path}")
+            pdf_path = future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate PDF: {e}")
+            return
+        messagebox.showinfo("PDF Generated", f"Quote saved to:\n{pdf_path}")
 
 
 class CustomerDialog(ctk.CTkToplevel):
@@ -717,6 +948,7 @@ class CustomerDialog(ctk.CTkToplevel):
             zip_code=self.entries['zip_code'].get().strip()
         )
         customer.save()
+        _add_cached_customer(customer)
         self.result = customer
         self.destroy()
 
@@ -826,7 +1058,7 @@ class MaterialDialog(ctk.CTkToplevel):
 
     def _on_category_change(self, category):
         """Handle category change."""
-        materials = Material.get_by_category(category)
+        materials = Material.get_rows_by_category(category)
         names = [m.name for m in materials]
         self.material.configure(values=names)
         self.materials_map = {m.name: m for m in materials}
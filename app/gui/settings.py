@@ -3,18 +3,28 @@ import customtkinter as ctk
 from tkinter import messagebox, filedialog
 from pathlib import Path
 
+from .fonts import get_font
 from ..models.database import get_db
 
 
 class SettingsPanel(ctk.CTkFrame):
     """Settings configuration panel."""
 
+    # (key, title); each section's widgets are built by _create_<key>_section
+    # the first time it is expanded
+    SECTIONS = (
+        ("company", "Company Information"),
+        ("quote", "Quote Settings"),
+        ("appearance", "Appearance"),
+        ("data", "Data Management"),
+    )
+
     def __init__(self, parent):
         super().__init__(parent, fg_color="transparent")
         self.db = get_db()
+        self._sections = {}
 
         self._create_layout()
-        self._load_settings()
 
     def _create_layout(self):
         """Create the settings layout."""
@@ -25,7 +35,7 @@ class SettingsPanel(ctk.CTkFrame):
         title = ctk.CTkLabel(
             header,
             text="Settings",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(size=24, weight="bold")
         )
         title.pack(side="left")
 
@@ -42,34 +52,54 @@ class SettingsPanel(ctk.CTkFrame):
         scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
         scroll.pack(fill="both", expand=True)
 
-        # Company Information Section
-        self._create_company_section(scroll)
-
-        # Quote Settings Section
-        self._create_quote_section(scroll)
-
-        # Appearance Section
-        self._create_appearance_section(scroll)
+        for key, title in self.SECTIONS:
+            self._create_section(scroll, key, title)
 
-        # Data Section
-        self._create_data_section(scroll)
-
-    def _create_section(self, parent, title: str) -> ctk.CTkFrame:
-        """Create a settings section."""
+    def _create_section(self, parent, key: str, title: str):
+        """Create a collapsible settings section whose content is built on first expand."""
         section = ctk.CTkFrame(parent)
         section.pack(fill="x", pady=10)
 
-        header = ctk.CTkLabel(
+        header = ctk.CTkButton(
             section,
-            text=title,
-            font=ctk.CTkFont(size=16, weight="bold")
+            text=f"▸ {title}",
+            anchor="w",
+            fg_color="transparent",
+            text_color=("gray10", "gray90"),
+            hover_color=("gray80", "gray25"),
+            font=get_font(size=16, weight="bold"),
+            command=lambda: self._toggle_section(key)
         )
-        header.pack(anchor="w", padx=15, pady=(15, 10))
+        header.pack(fill="x", padx=10, pady=10)
 
         content = ctk.CTkFrame(section, fg_color="transparent")
+        self._sections[key] = {'title': title, 'header': header, 'content': content, 'built': False}
+
+    def _toggle_section(self, key: str):
+        """Expand or collapse a section, building its widgets the first time."""
+        section = self._sections[key]
+        content = section['content']
+        if content.winfo_manager():
+            content.pack_forget()
+            section['header'].configure(text=f"▸ {section['title']}")
+            return
+
+        if not section['built']:
+            getattr(self, f"_create_{key}_section")(content)
+            section['built'] = True
+            # Let the new widgets paint before their values are read in
+            self.after_idle(self._fill_section, key)
         content.pack(fill="x", padx=15, pady=(0, 15))
+        section['header'].configure(text=f"▾ {section['title']}")
 
-        return content
+    def _fill_section(self, key: str):
+        """Fill a newly built section from the saved settings."""
+        if self.winfo_exists():
+            self._load_section(key, self.db.get_all_settings())
+
+    def _is_built(self, key: str) -> bool:
+        """Check whether a section's widgets exist yet."""
+        return self._sections[key]['built']
 
     def _create_field(self, parent, label: str, width: int = 300) -> ctk.CTkEntry:
         """Create a labeled entry field."""
@@ -82,10 +112,8 @@ class SettingsPanel(ctk.CTkFrame):
 
         return entry
 
-    def _create_company_section(self, parent):
+    def _create_company_section(self, content):
         """Create company information section."""
-        content = self._create_section(parent, "Company Information")
-
         self.company_name = self._create_field(content, "Company Name:")
         self.company_address = self._create_field(content, "Address:")
         self.company_phone = self._create_field(content, "Phone:")
@@ -114,10 +142,8 @@ class SettingsPanel(ctk.CTkFrame):
             command=self._choose_logo
         ).pack(side="left", padx=10)
 
-    def _create_quote_section(self, parent):
+    def _create_quote_section(self, content):
         """Create quote settings section."""
-        content = self._create_section(parent, "Quote Settings")
-
         # Labor rate
         rate_row = ctk.CTkFrame(content, fg_color="transparent")
         rate_row.pack(fill="x", pady=5)
@@ -157,10 +183,8 @@ class SettingsPanel(ctk.CTkFrame):
         self.quote_terms = ctk.CTkTextbox(terms_row, width=400, height=100)
         self.quote_terms.pack(side="left")
 
-    def _create_appearance_section(self, parent):
+    def _create_appearance_section(self, content):
         """Create appearance settings section."""
-        content = self._create_section(parent, "Appearance")
-
         # Theme
         theme_row = ctk.CTkFrame(content, fg_color="transparent")
         theme_row.pack(fill="x", pady=5)
@@ -178,10 +202,8 @@ class SettingsPanel(ctk.CTkFrame):
         )
         self.theme_select.pack(side="left")
 
-    def _create_data_section(self, parent):
+    def _create_data_section(self, content):
         """Create data management section."""
-        content = self._create_section(parent, "Data Management")
-
         # Database info
         db_path = self.db.db_path
         info_row = ctk.CTkFrame(content, fg_color="transparent")
@@ -209,56 +231,76 @@ class SettingsPanel(ctk.CTkFrame):
             command=self._reset_defaults
         ).pack(side="left")
 
+    @staticmethod
+    def _set_entry(entry: ctk.CTkEntry, value: str):
+        """Replace an entry's text."""
+        entry.delete(0, 'end')
+        entry.insert(0, value)
+
     def _load_settings(self):
-        """Load settings from database."""
+        """Load settings from database into every built section."""
         settings = self.db.get_all_settings()
-
-        self.company_name.insert(0, settings.get('company_name', ''))
-        self.company_address.insert(0, settings.get('company_address', ''))
-        self.company_phone.insert(0, settings.get('company_phone', ''))
-        self.company_email.insert(0, settings.get('company_email', ''))
-        self.company_license.insert(0, settings.get('company_license', ''))
-
-        self.labor_rate.insert(0, settings.get('labor_rate', '125.00'))
-        self.markup_percent.insert(0, settings.get('markup_percent', '30'))
-        self.tax_rate.insert(0, settings.get('tax_rate', '0.0'))
-        self.quote_prefix.insert(0, settings.get('quote_prefix', 'GQ'))
-        self.quote_terms.insert("1.0", settings.get('quote_terms', ''))
-
-        logo = settings.get('logo_path', '')
-        if logo:
-            self.logo_path_var.set(Path(logo).name)
-
-        theme = settings.get('theme', 'system')
-        self.theme_var.set(theme)
+        for key, _ in self.SECTIONS:
+            if self._is_built(key):
+                self._load_section(key, settings)
+
+    def _load_section(self, key: str, settings: dict):
+        """Fill a built section's fields from settings."""
+        if key == "company":
+            self._set_entry(self.company_name, settings.get('company_name', ''))
+            self._set_entry(self.company_address, settings.get('company_address', ''))
+            self._set_entry(self.company_phone, settings.get('company_phone', ''))
+            self._set_entry(self.company_email, settings.get('company_email', ''))
+            self._set_entry(self.company_license, settings.get('company_license', ''))
+
+            logo = settings.get('logo_path', '')
+            if logo:
+                self.logo_path_var.set(Path(logo).name)
+        elif key == "quote":
+            self._set_entry(self.labor_rate, settings.get('labor_rate', '125.00'))
+            self._set_entry(self.markup_percent, settings.get('markup_percent', '30'))
+            self._set_entry(self.tax_rate, settings.get('tax_rate', '0.0'))
+            self._set_entry(self.quote_prefix, settings.get('quote_prefix', 'GQ'))
+            self.quote_terms.delete("1.0", "end")
+            self.quote_terms.insert("1.0", settings.get('quote_terms', ''))
+        elif key == "appearance":
+            self.theme_var.set(settings.get('theme', 'system'))
 
     def _save_settings(self):
-        """Save settings to database."""
-        try:
-            # Validate numeric fields
-            float(self.labor_rate.get())
-            float(self.markup_percent.get())
-            float(self.tax_rate.get())
-        except ValueError:
-            messagebox.showerror("Error", "Labor rate, markup, and tax must be numbers")
-            return
+        """Save settings from the built sections to database."""
+        settings = {}
 
-        settings = {
-            'company_name': self.company_name.get().strip(),
-            'company_address': self.company_address.get().strip(),
-            'company_phone': self.company_phone.get().strip(),
-            'company_email': self.company_email.get().strip(),
-            'company_license': self.company_license.get().strip(),
-            'labor_rate': self.labor_rate.get().strip(),
-            'markup_percent': self.markup_percent.get().strip(),
-            'tax_rate': self.tax_rate.get().strip(),
-            'quote_prefix': self.quote_prefix.get().strip() or 'GQ',
-            'quote_terms': self.quote_terms.get("1.0", "end").strip(),
-            'theme': self.theme_var.get()
-        }
-
-        for key, value in settings.items():
-            self.db.set_setting(key, value)
+        if self._is_built("quote"):
+            try:
+                # Validate numeric fields
+                float(self.labor_rate.get())
+                float(self.markup_percent.get())
+                float(self.tax_rate.get())
+            except ValueError:
+                messagebox.showerror("Error", "Labor rate, markup, and tax must be numbers")
+                return
+
+            settings.update({
+                'labor_rate': self.labor_rate.get().strip(),
+                'markup_percent': self.markup_percent.get().strip(),
+                'tax_rate': self.tax_rate.get().strip(),
+                'quote_prefix': self.quote_prefix.get().strip() or 'GQ',
+                'quote_terms': self.quote_terms.get("1.0", "end").strip(),
+            })
+
+        if self._is_built("company"):
+            settings.update({
+                'company_name': self.company_name.get().strip(),
+                'company_address': self.company_address.get().strip(),
+                'company_phone': self.company_phone.get().strip(),
+                'company_email': self.company_email.get().strip(),
+                'company_license': self.company_license.get().strip(),
+            })
+
+        if self._is_built("appearance"):
+            settings['theme'] = self.theme_var.get()
+
+        self.db.set_settings(settings)
 
         messagebox.showinfo("Saved", "Settings saved successfully!")
 
@@ -320,16 +362,9 @@ class SettingsPanel(ctk.CTkFrame):
                 'theme': 'system'
             }
 
-            for key, value in defaults.items():
-                self.db.set_setting(key, value)
+            self.db.set_settings(defaults)
 
-            # Clear and reload form
-            for widget in [self.company_name, self.company_address, self.company_phone,
-                          self.company_email, self.company_license, self.labor_rate,
-                          self.markup_percent, self.tax_rate, self.quote_prefix]:
-                widget.delete(0, 'end')
-
-            self.quote_terms.delete("1.0", "end")
+            # Reload the fields of any expanded sections
             self._load_settings()
 
             messagebox.showinfo("Reset Complete", "Settings have been reset to defaults.")
@@ -1,13 +1,52 @@
 """Customer model for Gate Quote Pro."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
-from .database import get_db
+from typing import ClassVar, List, Optional, Tuple
+from .database import fts_substring_query, get_db
 
+# Inserts when id is NULL (or unknown), otherwise updates the existing row
+_SQL_UPSERT_CUSTOMER = """
+    INSERT INTO customers (id, name, email, phone, address, city, state, zip_code, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name, email = excluded.email, phone = excluded.phone,
+        address = excluded.address, city = excluded.city, state = excluded.state,
+        zip_code = excluded.zip_code, notes = excluded.notes
+    RETURNING id
+"""
 
-@dataclass
+# Contact columns in CONTACT_FIELDS order, blanks in place of NULLs
+_CONTACT_COLUMNS = """
+    c.id, c.name, COALESCE(c.email, ''), COALESCE(c.phone, ''), COALESCE(c.address, ''),
+    COALESCE(c.city, ''), COALESCE(c.state, ''), COALESCE(c.zip_code, ''), COALESCE(c.notes, '')
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class CustomerRow:
+    """Lightweight customer listing row."""
+    id: int
+    name: str
+    phone: str
+    email: str
+
+
+@dataclass(slots=True)
 class Customer:
     """Customer data model."""
+
+    # Customer columns for queries that LEFT JOIN customers AS c
+    JOINED_COLUMNS: ClassVar[str] = """
+        c.id AS c_id, c.name AS c_name, c.email AS c_email, c.phone AS c_phone,
+        c.address AS c_address, c.city AS c_city, c.state AS c_state,
+        c.zip_code AS c_zip_code, c.notes AS c_notes, c.created_at AS c_created_at
+    """
+
+    # Fields of the tuples returned by get_contact_rows
+    CONTACT_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'id', 'name', 'email', 'phone', 'address', 'city', 'state', 'zip_code', 'notes'
+    )
+
     id: Optional[int] = None
     name: str = ""
     email: str = ""
@@ -22,32 +61,20 @@ class Customer:
     @property
     def full_address(self) -> str:
         """Get formatted full address."""
-        parts = [self.address]
-        if self.city or self.state or self.zip_code:
-            city_state = f"{self.city}, {self.state} {self.zip_code}".strip()
-            parts.append(city_state)
-        return "\n".join(p for p in parts if p.strip())
+        city_state = (
+            f"{self.city}, {self.state} {self.zip_code}".strip(", ")
+            if self.city or self.state or self.zip_code else ""
+        )
+        return "\n".join(p for p in (self.address, city_state) if p and p.strip())
 
     def save(self) -> int:
         """Save customer to database."""
         db = get_db()
-        if self.id:
-            # Update existing
-            db.execute("""
-                UPDATE customers SET
-                    name = ?, email = ?, phone = ?, address = ?,
-                    city = ?, state = ?, zip_code = ?, notes = ?
-                WHERE id = ?
-            """, (self.name, self.email, self.phone, self.address,
-                  self.city, self.state, self.zip_code, self.notes, self.id))
-        else:
-            # Insert new
-            cursor = db.execute("""
-                INSERT INTO customers (name, email, phone, address, city, state, zip_code, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (self.name, self.email, self.phone, self.address,
-                  self.city, self.state, self.zip_code, self.notes))
-            self.id = cursor.lastrowid
+        cursor = db.execute(_SQL_UPSERT_CUSTOMER, (
+            self.id or None, self.name, self.email, self.phone, self.address,
+            self.city, self.state, self.zip_code, self.notes
+        ))
+        self.id = cursor.fetchone()[0]
         db.commit()
         return self.id
 
@@ -76,16 +103,84 @@ class Customer:
         return [cls._from_row(row) for row in cursor.fetchall()]
 
     @classmethod
-    def search(cls, query: str) -> List['Customer']:
-        """Search customers by name, email, or phone."""
+    def get_all_rows(cls) -> List[CustomerRow]:
+        """Get listing rows for all customers."""
         db = get_db()
-        search_term = f"%{query}%"
         cursor = db.execute("""
-            SELECT * FROM customers
-            WHERE name LIKE ? OR email LIKE ? OR phone LIKE ?
-            ORDER BY name
-        """, (search_term, search_term, search_term))
-        return [cls._from_row(row) for row in cursor.fetchall()]
+            SELECT id, name, COALESCE(phone, ''), COALESCE(email, '')
+            FROM customers ORDER BY name
+        """)
+        return [CustomerRow(*row) for row in cursor.fetchall()]
+
+    @classmethod
+    def _search(cls, columns: str, query: str, limit: int = None, offset: int = 0) -> list:
+        """Run a customer search selecting columns (qualified with c.), optionally one page."""
+        db = get_db()
+        match = fts_substring_query(query)
+        if db.has_fts and match:
+            # A trigram phrase matches the same rows as the LIKE scan below
+            sql = f"""
+                SELECT {columns} FROM customers_fts f
+                JOIN customers c ON c.id = f.rowid
+                WHERE customers_fts MATCH ?
+                ORDER BY c.name, c.id
+            """
+            params = (match,)
+        else:
+            search_term = f"%{query}%"
+            sql = f"""
+                SELECT {columns} FROM customers c
+                WHERE c.name LIKE ? OR c.email LIKE ? OR c.phone LIKE ?
+                ORDER BY c.name, c.id
+            """
+            params = (search_term, search_term, search_term)
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += (limit, offset)
+        return db.execute(sql, params).fetchall()
+
+    @classmethod
+    def search_rows(cls, query: str) -> List[CustomerRow]:
+        """Search customers by name, email, or phone, returning listing rows."""
+        rows = cls._search(
+            "c.id, c.name, COALESCE(c.phone, ''), COALESCE(c.email, '')", query
+        )
+        return [CustomerRow(*row) for row in rows]
+
+    @classmethod
+    def get_contact_rows(cls, query: str = None, limit: int = None, offset: int = 0) -> list:
+        """Get CONTACT_FIELDS rows for all customers, or those matching a search."""
+        if query:
+            return cls._search(_CONTACT_COLUMNS, query, limit, offset)
+        db = get_db()
+        # Names can repeat, so id keeps pages stable
+        sql = f"SELECT {_CONTACT_COLUMNS} FROM customers c ORDER BY c.name, c.id"
+        if limit is not None:
+            return db.execute(sql + " LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+        return db.execute(sql).fetchall()
+
+    @classmethod
+    def search(cls, query: str) -> List['Customer']:
+        """Search customers by name, email, or phone."""
+        return [cls._from_row(row) for row in cls._search("c.*", query)]
+
+    @classmethod
+    def _from_joined_row(cls, row) -> Optional['Customer']:
+        """Create Customer from the c_-prefixed columns of JOINED_COLUMNS, if any."""
+        if row['c_id'] is None:
+            return None
+        return cls(
+            id=row['c_id'],
+            name=row['c_name'],
+            email=row['c_email'] or "",
+            phone=row['c_phone'] or "",
+            address=row['c_address'] or "",
+            city=row['c_city'] or "",
+            state=row['c_state'] or "",
+            zip_code=row['c_zip_code'] or "",
+            notes=row['c_notes'] or "",
+            created_at=row['c_created_at']
+        )
 
     @classmethod
     def _from_row(cls, row) -> 'Customer':
@@ -1,8 +1,23 @@
 """Database connection manager for Gate Quote Pro."""
 import sqlite3
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
+from typing import Optional, Tuple
+
+# Bump whenever _create_tables changes so existing databases re-run it
+SCHEMA_VERSION = 6
+
+_SQL_SET_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+
+
+def fts_substring_query(query: str) -> Optional[str]:
+    """Build a trigram MATCH phrase equivalent to LIKE '%query%', if there is one."""
+    # Trigrams need three characters, and LIKE wildcards have no MATCH form
+    if len(query) < 3 or '%' in query or '_' in query:
+        return None
+    return '"' + query.replace('"', '""') + '"'
 
 
 class Database:
@@ -16,17 +31,53 @@ class Database:
             db_path = str(app_support / "gatequote.db")
 
         self.db_path = db_path
-        self.connection = None
-        self._connect()
+        self._local = threading.local()
+        self._shared_connection = None
+        self._settings_cache = None
+        self.has_fts = False
         self._create_tables()
 
-    def _connect(self):
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if self.db_path == ":memory:":
+                # Every in-memory connection is its own database, so share one
+                if self._shared_connection is None:
+                    self._shared_connection = self._connect()
+                connection = self._shared_connection
+            else:
+                connection = self._connect()
+            self._local.connection = connection
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
         """Establish database connection."""
-        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.connection.row_factory = sqlite3.Row
+        # A generous busy timeout lets a thread wait out another thread's
+        # long write transaction, such as a CSV import.
+        connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        # WAL lets commits skip the rollback-journal fsync and readers run
+        # alongside a writer; the larger cache and mmap cut page reads.
+        connection.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA cache_size=-20000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+        """)
+        return connection
 
     def _create_tables(self):
         """Create database tables if they don't exist."""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            self.has_fts = self.connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'customers_fts' AND sql LIKE '%trigram%'"
+            ).fetchone() is not None
+            return
+
         cursor = self.connection.cursor()
 
         # Customers table
@@ -106,6 +157,38 @@ class Database:
             )
         """)
 
+        # Indexes for the name-ordered listings and category lookups
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_customers_name ON customers(name)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_materials_cat_name ON materials(category, name)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_materials_name ON materials(name COLLATE NOCASE)"
+        )
+
+        # Indexes for item lookups by quote and the newest-first quote listings
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_quote_items_quote_id ON quote_items(quote_id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_quotes_status_created ON quotes(status, created_at DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_quotes_created ON quotes(created_at DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_quotes_customer_created ON quotes(customer_id, created_at DESC)"
+        )
+
+        # Supplier price cache (payload is a JSON-encoded PriceResult)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS price_cache (
+                url TEXT PRIMARY KEY,
+                ts INTEGER,
+                payload TEXT
+            )
+        """)
+
         # Company settings
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS settings (
@@ -114,11 +197,78 @@ class Database:
             )
         """)
 
+        # Counters such as the quote number sequence, seeded from existing quotes
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sequences (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            INSERT OR IGNORE INTO sequences (name, value)
+            SELECT 'quote_number', COALESCE(MAX(id), 0) FROM quotes
+        """)
+
         self.connection.commit()
 
+        self._create_fts('customers', ('name', 'email', 'phone'))
+        self._create_fts('materials', ('name',))
+
         # Initialize default settings if not present
         self._init_default_settings()
 
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _create_fts(self, table: str, columns: Tuple[str, ...]):
+        """Create a trigram index over columns of table, kept in sync by triggers."""
+        fts = f"{table}_fts"
+        cols = ", ".join(columns)
+        new = ", ".join(f"new.{column}" for column in columns)
+        old = ", ".join(f"old.{column}" for column in columns)
+        row = self.connection.execute(
+            "SELECT sql FROM sqlite_master WHERE name = ?", (fts,)
+        ).fetchone()
+        exists = row is not None and 'trigram' in row[0]
+        drop = ""
+        if row is not None and not exists:
+            # Word tokenizers only find word prefixes; rebuild as trigrams
+            drop = f"""
+                DROP TRIGGER IF EXISTS {fts}_ai;
+                DROP TRIGGER IF EXISTS {fts}_ad;
+                DROP TRIGGER IF EXISTS {fts}_au;
+                DROP TABLE {fts};
+            """
+        # Index rows saved before the table existed
+        rebuild = "" if exists else f"INSERT INTO {fts} ({fts}) VALUES ('rebuild');"
+        try:
+            # One explicit transaction, so a failure can't leave the triggers
+            # pointing at a dropped table
+            self.connection.executescript(f"""
+                BEGIN;
+                {drop}
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                    {cols}, content='{table}', content_rowid='id', tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new});
+                END;
+                CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                    INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});
+                END;
+                CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+                    INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});
+                    INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new});
+                END;
+                {rebuild}
+                COMMIT;
+            """)
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 trigrams; searches fall back to LIKE
+            if self.connection.in_transaction:
+                self.connection.execute("ROLLBACK")
+            return
+        self.has_fts = True
+
     def _init_default_settings(self):
         """Initialize default settings."""
         defaults = {
@@ -134,13 +284,16 @@ class Database:
             'quote_prefix': 'GQ'
         }
 
-        cursor = self.connection.cursor()
-        for key, value in defaults.items():
-            cursor.execute(
+        # An initialized database already holds at least every default key
+        count = self.connection.execute("SELECT COUNT(*) FROM settings").fetchone()[0]
+        if count >= len(defaults):
+            return
+
+        with self.connection:
+            self.connection.executemany(
                 "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
-                (key, value)
+                defaults.items()
             )
-        self.connection.commit()
 
     def execute(self, query: str, params: tuple = None):
         """Execute a query and return cursor."""
@@ -151,33 +304,57 @@ class Database:
             cursor.execute(query)
         return cursor
 
+    def executemany(self, query: str, params_seq):
+        """Execute a query once per parameter tuple and return cursor."""
+        cursor = self.connection.cursor()
+        cursor.executemany(query, params_seq)
+        return cursor
+
     def commit(self):
         """Commit transaction."""
         self.connection.commit()
 
     def close(self):
-        """Close database connection."""
-        if self.connection:
-            self.connection.close()
+        """Close the calling thread's database connection."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _get_settings_cache(self) -> dict:
+        """Get the cached settings, loading them with one query on first use."""
+        if self._settings_cache is None:
+            cursor = self.execute("SELECT key, value FROM settings")
+            self._settings_cache = {row['key']: row['value'] for row in cursor.fetchall()}
+        return self._settings_cache
 
     def get_setting(self, key: str, default: str = None) -> str:
         """Get a setting value."""
-        cursor = self.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = cursor.fetchone()
-        return row['value'] if row else default
+        return self._get_settings_cache().get(key, default)
 
     def set_setting(self, key: str, value: str):
         """Set a setting value."""
         self.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            _SQL_SET_SETTING,
             (key, value)
         )
         self.commit()
+        if self._settings_cache is not None:
+            self._settings_cache[key] = value
+
+    def set_settings(self, items: dict):
+        """Set several setting values in a single transaction."""
+        with self.connection:
+            self.connection.executemany(
+                _SQL_SET_SETTING,
+                items.items()
+            )
+        if self._settings_cache is not None:
+            self._settings_cache.update(items)
 
     def get_all_settings(self) -> dict:
         """Get all settings as a dictionary."""
-        cursor = self.execute("SELECT key, value FROM settings")
-        return {row['key']: row['value'] for row in cursor.fetchall()}
+        return dict(self._get_settings_cache())
 
 
 # Global database instance
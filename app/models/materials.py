@@ -1,13 +1,80 @@
 """Materials/Price list model for Gate Quote Pro."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 import json
+import re
 from pathlib import Path
-from .database import get_db
+from .database import fts_substring_query, get_db
 
+_SQL_INSERT_MATERIAL = """
+    INSERT INTO materials (category, name, unit, cost, markup, supplier, supplier_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+# Inserts when id is NULL (or unknown), otherwise updates the existing row
+_SQL_UPSERT_MATERIAL = """
+    INSERT INTO materials (id, category, name, unit, cost, markup, supplier, supplier_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        category = excluded.category, name = excluded.name, unit = excluded.unit,
+        cost = excluded.cost, markup = excluded.markup, supplier = excluded.supplier,
+        supplier_url = excluded.supplier_url, last_updated = CURRENT_TIMESTAMP
+    RETURNING id
+"""
 
-@dataclass
+_ROW_COLUMNS = """
+    SELECT id, COALESCE(category, ''), name, COALESCE(unit, 'each'), COALESCE(cost, 0.0)
+    FROM materials
+"""
+
+
+# Distinct categories and rows per category, cached until a material write bumps the version
+_materials_version = 0
+_categories_cache = {'version': -1, 'categories': []}
+_category_rows_cache = {'version': -1, 'rows': {}}
+_keyword_cache = {'version': -1, 'index': {}}
+
+# Price list name fragments that quote suggestions look up
+MATERIAL_KEYWORDS = (
+    'steel swing gate panel', 'aluminum swing gate panel', 'wrought iron gate panel',
+    'wood gate panel', 'chain link gate', 'post 6x6', 'heavy duty hinges', 'cantilever',
+    'v-track', 'gate latch - heavy duty', 'liftmaster la400', 'mighty mule mm560',
+    'liftmaster rsl12u', 'safety photoeye', 'wireless keypad', 'remote control (pack of 3)',
+    'intercom system - basic', 'telephone entry system', 'electrical wire', 'conduit',
+    'concrete', 'existing gate removal'
+)
+
+# Keywords that only match materials sold in this unit
+KEYWORD_UNITS = {'concrete': 'bag'}
+
+# Finds every keyword in a name in one pass; the lookahead reports overlapping
+# matches, and no keyword is a prefix of another, so none are missed
+_KEYWORD_RE = re.compile('(?=(' + '|'.join(map(re.escape, MATERIAL_KEYWORDS)) + '))')
+
+
+def _bump_version():
+    """Mark cached material queries stale after a write."""
+    global _materials_version
+    _materials_version += 1
+
+
+def get_materials_version() -> int:
+    """Get a counter that changes whenever the materials table is written."""
+    return _materials_version
+
+
+@dataclass(slots=True, frozen=True)
+class MaterialRow:
+    """Lightweight material listing row."""
+    id: int
+    category: str
+    name: str
+    unit: str
+    cost: float
+
+
+@dataclass(slots=True)
 class Material:
     """Material/product data model."""
     id: Optional[int] = None
@@ -28,23 +95,13 @@ class Material:
     def save(self) -> int:
         """Save material to database."""
         db = get_db()
-        if self.id:
-            db.execute("""
-                UPDATE materials SET
-                    category = ?, name = ?, unit = ?, cost = ?,
-                    markup = ?, supplier = ?, supplier_url = ?,
-                    last_updated = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (self.category, self.name, self.unit, self.cost,
-                  self.markup, self.supplier, self.supplier_url, self.id))
-        else:
-            cursor = db.execute("""
-                INSERT INTO materials (category, name, unit, cost, markup, supplier, supplier_url)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (self.category, self.name, self.unit, self.cost,
-                  self.markup, self.supplier, self.supplier_url))
-            self.id = cursor.lastrowid
+        cursor = db.execute(_SQL_UPSERT_MATERIAL, (
+            self.id or None, self.category, self.name, self.unit, self.cost,
+            self.markup, self.supplier, self.supplier_url
+        ))
+        self.id = cursor.fetchone()[0]
         db.commit()
+        _bump_version()
         return self.id
 
     def delete(self):
@@ -53,6 +110,7 @@ class Material:
             db = get_db()
             db.execute("DELETE FROM materials WHERE id = ?", (self.id,))
             db.commit()
+            _bump_version()
 
     @classmethod
     def get_by_id(cls, material_id: int) -> Optional['Material']:
@@ -65,43 +123,117 @@ class Material:
         return None
 
     @classmethod
-    def get_all(cls) -> List['Material']:
-        """Get all materials."""
+    def get_all(cls, limit: int = None, offset: int = 0) -> List['Material']:
+        """Get all materials, or one page of them."""
         db = get_db()
-        cursor = db.execute("SELECT * FROM materials ORDER BY category, name")
+        if limit is not None:
+            cursor = db.execute(
+                "SELECT * FROM materials ORDER BY category, name, id LIMIT ? OFFSET ?", (limit, offset)
+            )
+        else:
+            cursor = db.execute("SELECT * FROM materials ORDER BY category, name, id")
         return [cls._from_row(row) for row in cursor.fetchall()]
 
     @classmethod
-    def get_by_category(cls, category: str) -> List['Material']:
-        """Get materials by category."""
+    def count(cls) -> int:
+        """Get the number of materials."""
         db = get_db()
-        cursor = db.execute(
-            "SELECT * FROM materials WHERE category = ? ORDER BY name",
-            (category,)
-        )
+        cursor = db.execute("SELECT COUNT(*) AS count FROM materials")
+        return cursor.fetchone()['count']
+
+    @classmethod
+    def get_by_category(cls, category: str, limit: int = None, offset: int = 0) -> List['Material']:
+        """Get materials by category, or one page of them."""
+        db = get_db()
+        sql = "SELECT * FROM materials WHERE category = ? ORDER BY name, id"
+        params = (category,)
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += (limit, offset)
+        cursor = db.execute(sql, params)
         return [cls._from_row(row) for row in cursor.fetchall()]
 
+    @classmethod
+    def get_all_rows(cls) -> List[MaterialRow]:
+        """Get listing rows for all materials."""
+        db = get_db()
+        cursor = db.execute(_ROW_COLUMNS + " ORDER BY category, name")
+        return [MaterialRow(*row) for row in cursor.fetchall()]
+
+    @classmethod
+    def get_rows_by_category(cls, category: str) -> List[MaterialRow]:
+        """Get listing rows for materials in a category."""
+        if _category_rows_cache['version'] != _materials_version:
+            _category_rows_cache['rows'] = {}
+            _category_rows_cache['version'] = _materials_version
+        rows = _category_rows_cache['rows']
+        if category not in rows:
+            db = get_db()
+            cursor = db.execute(_ROW_COLUMNS + " WHERE category = ? ORDER BY name", (category,))
+            rows[category] = [MaterialRow(*row) for row in cursor.fetchall()]
+        return list(rows[category])
+
     @classmethod
     def get_categories(cls) -> List[str]:
         """Get list of unique categories."""
-        db = get_db()
-        cursor = db.execute("SELECT DISTINCT category FROM materials ORDER BY category")
-        return [row['category'] for row in cursor.fetchall()]
+        if _categories_cache['version'] != _materials_version:
+            version = _materials_version
+            db = get_db()
+            cursor = db.execute("SELECT DISTINCT category FROM materials ORDER BY category")
+            _categories_cache['categories'] = [row['category'] for row in cursor.fetchall()]
+            _categories_cache['version'] = version
+        return list(_categories_cache['categories'])
+
+    @classmethod
+    def get_keyword_index(cls) -> Dict[str, MaterialRow]:
+        """Get the first material (in price list order) matching each of MATERIAL_KEYWORDS."""
+        if _keyword_cache['version'] != _materials_version:
+            version = _materials_version
+            index = {}
+            for material in cls.get_all_rows():
+                for match in _KEYWORD_RE.finditer(material.name.lower()):
+                    keyword = match.group(1)
+                    if keyword in index:
+                        continue
+                    unit = KEYWORD_UNITS.get(keyword)
+                    if unit and unit not in material.unit.lower():
+                        continue
+                    index[keyword] = material
+            _keyword_cache['index'] = index
+            _keyword_cache['version'] = version
+        return _keyword_cache['index']
 
     @classmethod
-    def search(cls, query: str) -> List['Material']:
-        """Search materials by name."""
+    def search(cls, query: str, limit: int = None, offset: int = 0) -> List['Material']:
+        """Search materials by name, returning all matches or one page of them."""
         db = get_db()
-        search_term = f"%{query}%"
-        cursor = db.execute(
-            "SELECT * FROM materials WHERE name LIKE ? ORDER BY category, name",
-            (search_term,)
-        )
-        return [cls._from_row(row) for row in cursor.fetchall()]
+        match = fts_substring_query(query)
+        if db.has_fts and match:
+            # A trigram phrase matches the same rows as the LIKE scan below
+            sql = """
+                SELECT m.* FROM materials_fts f
+                JOIN materials m ON m.id = f.rowid
+                WHERE materials_fts MATCH ?
+                ORDER BY m.category, m.name, m.id
+            """
+            params = (match,)
+        else:
+            sql = "SELECT * FROM materials WHERE name LIKE ? ORDER BY category, name, id"
+            params = (f"%{query}%",)
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += (limit, offset)
+        return [cls._from_row(row) for row in db.execute(sql, params)]
 
     @classmethod
     def load_defaults(cls, json_path: str = None):
         """Load default materials from JSON file."""
+        db = get_db()
+
+        # Don't overwrite existing materials; checked first so startup skips the file
+        if db.execute("SELECT 1 FROM materials LIMIT 1").fetchone():
+            return
+
         if json_path is None:
             # Try to find the default prices file
             possible_paths = [
@@ -119,66 +251,93 @@ class Material:
         with open(json_path, 'r') as f:
             data = json.load(f)
 
-        db = get_db()
-
-        # Check if we already have materials
-        cursor = db.execute("SELECT COUNT(*) as count FROM materials")
-        if cursor.fetchone()['count'] > 0:
-            return  # Don't overwrite existing materials
-
-        # Load materials from each category
-        for category, items in data.items():
-            for item in items:
-                material = cls(
-                    category=item.get('category', category),
-                    name=item['name'],
-                    unit=item.get('unit', 'each'),
-                    cost=item['cost'],
-                    markup=1.3
-                )
-                material.save()
+        # Load materials from each category in a single transaction
+        rows = [
+            (item.get('category', category), item['name'], item.get('unit', 'each'),
+             item['cost'], 1.3, '', '')
+            for category, items in data.items()
+            for item in items
+        ]
+        with db.connection:
+            db.executemany(_SQL_INSERT_MATERIAL, rows)
+        _bump_version()
 
     @classmethod
     def import_from_csv(cls, csv_path: str) -> int:
         """Import materials from CSV file. Returns count of imported items."""
-        import csv
         count = 0
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                material = cls(
-                    category=row.get('category', 'misc'),
-                    name=row['name'],
-                    unit=row.get('unit', 'each'),
-                    cost=float(row.get('cost', 0)),
-                    markup=float(row.get('markup', 1.3)),
-                    supplier=row.get('supplier', ''),
-                    supplier_url=row.get('supplier_url', '')
-                )
-                material.save()
-                count += 1
+        for count, _ in cls.iter_import_from_csv(csv_path):
+            pass
         return count
 
+    @classmethod
+    def iter_import_from_csv(cls, csv_path: str, chunk_size: int = 1000) -> Iterator[Tuple[int, int]]:
+        """Stream materials from a CSV file in batches, yielding (done, total) after each.
+
+        The whole file is imported in one transaction, so a bad row rolls back every batch.
+        """
+        import csv
+        db = get_db()
+        try:
+            with open(csv_path, 'r', newline='') as f, db.connection:
+                total = sum(1 for _ in csv.DictReader(f))
+                f.seek(0)
+                reader = csv.DictReader(f)
+
+                done = 0
+                while True:
+                    batch = [
+                        (
+                            row.get('category', 'misc'),
+                            row['name'],
+                            row.get('unit', 'each'),
+                            float(row.get('cost', 0)),
+                            float(row.get('markup', 1.3)),
+                            row.get('supplier', ''),
+                            row.get('supplier_url', '')
+                        )
+                        for row in islice(reader, chunk_size)
+                    ]
+                    if not batch:
+                        break
+
+                    db.executemany(_SQL_INSERT_MATERIAL, batch)
+
+                    done += len(batch)
+                    yield done, total
+        finally:
+            _bump_version()
+
     @classmethod
     def export_to_csv(cls, csv_path: str):
         """Export all materials to CSV file."""
+        for _ in cls.iter_export_to_csv(csv_path):
+            pass
+
+    @classmethod
+    def iter_export_to_csv(cls, csv_path: str, batch: int = 1000) -> Iterator[Tuple[int, int]]:
+        """Stream all materials to a CSV file, yielding (done, total) after each batch."""
         import csv
-        materials = cls.get_all()
+        total = cls.count()
+        # Rows go straight from the cursor to the writer, skipping Material objects
+        cursor = get_db().execute("""
+            SELECT COALESCE(category, ''), name, COALESCE(unit, 'each'), COALESCE(cost, 0.0),
+                   COALESCE(markup, 1.3), COALESCE(supplier, ''), COALESCE(supplier_url, '')
+            FROM materials ORDER BY category, name
+        """)
         with open(csv_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=[
+            writer = csv.writer(f)
+            writer.writerow([
                 'category', 'name', 'unit', 'cost', 'markup', 'supplier', 'supplier_url'
             ])
-            writer.writeheader()
-            for m in materials:
-                writer.writerow({
-                    'category': m.category,
-                    'name': m.name,
-                    'unit': m.unit,
-                    'cost': m.cost,
-                    'markup': m.markup,
-                    'supplier': m.supplier,
-                    'supplier_url': m.supplier_url
-                })
+            done = 0
+            while True:
+                rows = cursor.fetchmany(batch)
+                if not rows:
+                    break
+                writer.writerows(rows)
+                done += len(rows)
+                yield done, total
 
     @classmethod
     def _from_row(cls, row) -> 'Material':
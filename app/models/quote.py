@@ -1,12 +1,46 @@
 """Quote model for Gate Quote Pro."""
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import List, Optional
+from typing import ClassVar, List, Optional, Tuple
 from .database import get_db
 from .customer import Customer
 
-
-@dataclass
+# Updates items that already belong to the quote and inserts the rest (id NULL)
+_SQL_UPSERT_ITEM = """
+    INSERT INTO quote_items (id, quote_id, category, description, quantity, unit, unit_cost, total_cost)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        category = excluded.category, description = excluded.description,
+        quantity = excluded.quantity, unit = excluded.unit,
+        unit_cost = excluded.unit_cost, total_cost = excluded.total_cost
+"""
+
+
+def _quote_totals(materials_cost: float, labor_hours: float, labor_rate: float,
+                  markup_percent: float, tax_rate: float) -> Tuple[float, float, float]:
+    """Compute (subtotal, tax_amount, total) from a quote's cost inputs."""
+    # Markup applies to materials only
+    subtotal = materials_cost * (1 + markup_percent / 100) + labor_hours * labor_rate
+    tax_amount = subtotal * (tax_rate / 100)
+    return subtotal, tax_amount, subtotal + tax_amount
+
+
+@dataclass(slots=True, frozen=True)
+class QuoteRow:
+    """Lightweight quote listing row with the customer name pre-joined."""
+    id: int
+    quote_number: str
+    customer_id: Optional[int]
+    customer_name: Optional[str]
+    gate_type: str
+    width: float
+    height: float
+    total: float
+    status: str
+    created_at: datetime
+
+
+@dataclass(slots=True)
 class QuoteItem:
     """Individual line item in a quote."""
     id: Optional[int] = None
@@ -22,10 +56,28 @@ class QuoteItem:
         """Calculate total cost for this item."""
         self.total_cost = self.quantity * self.unit_cost
 
+    @classmethod
+    def _from_row(cls, row) -> 'QuoteItem':
+        """Create QuoteItem from a row selected with _ITEM_COLUMNS."""
+        return cls(*row)
+
 
-@dataclass
+# Item columns in field order, so rows unpack positionally
+_ITEM_COLUMNS = "i.id, i.quote_id, i.category, i.description, i.quantity, i.unit, i.unit_cost, i.total_cost"
+
+
+@dataclass(slots=True)
 class Quote:
     """Quote data model."""
+
+    # Stored columns in field order, so rows unpack positionally in _from_row
+    _COLUMNS: ClassVar[Tuple[str, ...]] = (
+        'id', 'customer_id', 'quote_number', 'gate_type', 'gate_style', 'width', 'height',
+        'material', 'automation', 'access_control', 'ground_type', 'slope', 'power_distance',
+        'removal_needed', 'labor_hours', 'labor_rate', 'materials_cost', 'markup_percent',
+        'tax_rate', 'subtotal', 'tax_amount', 'total', 'status', 'notes',
+        'created_at', 'updated_at'
+    )
     id: Optional[int] = None
     customer_id: Optional[int] = None
     quote_number: str = ""
@@ -67,13 +119,26 @@ class Quote:
     customer: Optional[Customer] = None
     items: List[QuoteItem] = field(default_factory=list)
 
+    # Signature of the items as last loaded or saved, to skip unchanged saves
+    _saved_items: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def generate_quote_number(self) -> str:
         """Generate a unique quote number."""
         db = get_db()
         prefix = db.get_setting('quote_prefix', 'GQ')
-        cursor = db.execute("SELECT MAX(id) as max_id FROM quotes")
-        row = cursor.fetchone()
-        next_id = (row['max_id'] or 0) + 1
+        # The increment is atomic, so concurrent saves never share a number
+        row = db.execute(
+            "UPDATE sequences SET value = value + 1 WHERE name = 'quote_number' RETURNING value"
+        ).fetchone()
+        if row is not None:
+            next_id = row[0]
+        else:
+            cursor = db.execute("SELECT MAX(id) as max_id FROM quotes")
+            next_id = (cursor.fetchone()['max_id'] or 0) + 1
+            db.execute(
+                "INSERT OR IGNORE INTO sequences (name, value) VALUES ('quote_number', ?)",
+                (next_id,)
+            )
         date_str = datetime.now().strftime('%Y%m')
         return f"{prefix}-{date_str}-{next_id:04d}"
 
@@ -82,113 +147,138 @@ class Quote:
         # Sum up materials
         self.materials_cost = sum(item.total_cost for item in self.items)
 
-        # Calculate labor cost
-        labor_cost = self.labor_hours * self.labor_rate
-
-        # Apply markup to materials
-        materials_with_markup = self.materials_cost * (1 + self.markup_percent / 100)
-
-        # Subtotal
-        self.subtotal = materials_with_markup + labor_cost
-
-        # Tax
-        self.tax_amount = self.subtotal * (self.tax_rate / 100)
-
-        # Total
-        self.total = self.subtotal + self.tax_amount
+        self.subtotal, self.tax_amount, self.total = _quote_totals(
+            self.materials_cost, self.labor_hours, self.labor_rate,
+            self.markup_percent, self.tax_rate
+        )
 
     def save(self) -> int:
         """Save quote to database."""
         db = get_db()
 
-        if not self.quote_number:
-            self.quote_number = self.generate_quote_number()
-
-        self.calculate_totals()
-
-        if self.id:
-            # Update existing
-            db.execute("""
-                UPDATE quotes SET
-                    customer_id = ?, quote_number = ?, gate_type = ?, gate_style = ?,
-                    width = ?, height = ?, material = ?, automation = ?,
-                    access_control = ?, ground_type = ?, slope = ?, power_distance = ?,
-                    removal_needed = ?, labor_hours = ?, labor_rate = ?,
-                    materials_cost = ?, markup_percent = ?, tax_rate = ?,
-                    subtotal = ?, tax_amount = ?, total = ?, status = ?, notes = ?,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (self.customer_id, self.quote_number, self.gate_type, self.gate_style,
-                  self.width, self.height, self.material, self.automation,
-                  self.access_control, self.ground_type, self.slope, self.power_distance,
-                  1 if self.removal_needed else 0, self.labor_hours, self.labor_rate,
-                  self.materials_cost, self.markup_percent, self.tax_rate,
-                  self.subtotal, self.tax_amount, self.total, self.status, self.notes,
-                  self.id))
-        else:
-            # Insert new
-            cursor = db.execute("""
-                INSERT INTO quotes (
-                    customer_id, quote_number, gate_type, gate_style, width, height,
-                    material, automation, access_control, ground_type, slope,
-                    power_distance, removal_needed, labor_hours, labor_rate,
-                    materials_cost, markup_percent, tax_rate, subtotal, tax_amount,
-                    total, status, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (self.customer_id, self.quote_number, self.gate_type, self.gate_style,
-                  self.width, self.height, self.material, self.automation,
-                  self.access_control, self.ground_type, self.slope, self.power_distance,
-                  1 if self.removal_needed else 0, self.labor_hours, self.labor_rate,
-                  self.materials_cost, self.markup_percent, self.tax_rate,
-                  self.subtotal, self.tax_amount, self.total, self.status, self.notes))
-            self.id = cursor.lastrowid
-
-        db.commit()
-
-        # Save line items
-        self._save_items()
-
+        # The quote row and its items are written in a single transaction
+        with db.connection:
+            if not self.quote_number:
+                self.quote_number = self.generate_quote_number()
+
+            self.calculate_totals()
+
+            if self.id:
+                # Update existing
+                db.execute("""
+                    UPDATE quotes SET
+                        customer_id = ?, quote_number = ?, gate_type = ?, gate_style = ?,
+                        width = ?, height = ?, material = ?, automation = ?,
+                        access_control = ?, ground_type = ?, slope = ?, power_distance = ?,
+                        removal_needed = ?, labor_hours = ?, labor_rate = ?,
+                        materials_cost = ?, markup_percent = ?, tax_rate = ?,
+                        subtotal = ?, tax_amount = ?, total = ?, status = ?, notes = ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (self.customer_id, self.quote_number, self.gate_type, self.gate_style,
+                      self.width, self.height, self.material, self.automation,
+                      self.access_control, self.ground_type, self.slope, self.power_distance,
+                      1 if self.removal_needed else 0, self.labor_hours, self.labor_rate,
+                      self.materials_cost, self.markup_percent, self.tax_rate,
+                      self.subtotal, self.tax_amount, self.total, self.status, self.notes,
+                      self.id))
+            else:
+                # Insert new
+                cursor = db.execute("""
+                    INSERT INTO quotes (
+                        customer_id, quote_number, gate_type, gate_style, width, height,
+                        material, automation, access_control, ground_type, slope,
+                        power_distance, removal_needed, labor_hours, labor_rate,
+                        materials_cost, markup_percent, tax_rate, subtotal, tax_amount,
+                        total, status, notes
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (self.customer_id, self.quote_number, self.gate_type, self.gate_style,
+                      self.width, self.height, self.material, self.automation,
+                      self.access_control, self.ground_type, self.slope, self.power_distance,
+                      1 if self.removal_needed else 0, self.labor_hours, self.labor_rate,
+                      self.materials_cost, self.markup_percent, self.tax_rate,
+                      self.subtotal, self.tax_amount, self.total, self.status, self.notes))
+                self.id = cursor.lastrowid
+
+            # Save line items
+            self._save_items()
+
+        self._saved_items = self._items_signature()
         return self.id
 
+    def _items_signature(self) -> tuple:
+        """Identify the stored state of the line items."""
+        return tuple(
+            (item.id, item.category, item.description, item.quantity,
+             item.unit, item.unit_cost, item.total_cost)
+            for item in self.items
+        )
+
     def _save_items(self):
-        """Save quote line items."""
-        if not self.id:
+        """Save quote line items, writing only what changed.
+
+        Runs inside the caller's transaction; save() commits it.
+        """
+        if not self.id or self._items_signature() == self._saved_items:
             return
 
         db = get_db()
+        cursor = db.execute("SELECT id FROM quote_items WHERE quote_id = ?", (self.id,))
+        existing = {row[0] for row in cursor}
 
-        # Delete existing items
-        db.execute("DELETE FROM quote_items WHERE quote_id = ?", (self.id,))
-
-        # Insert new items
+        # Only ids already stored for this quote are reused; anything else is inserted
         for item in self.items:
             item.quote_id = self.id
-            db.execute("""
-                INSERT INTO quote_items (quote_id, category, description, quantity, unit, unit_cost, total_cost)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (item.quote_id, item.category, item.description, item.quantity,
-                  item.unit, item.unit_cost, item.total_cost))
+            if item.id not in existing:
+                item.id = None
+
+        # Delete items that were removed
+        removed = existing - {item.id for item in self.items}
+        if removed:
+            db.execute(
+                f"DELETE FROM quote_items WHERE id IN ({','.join('?' * len(removed))})",
+                tuple(removed)
+            )
 
-        db.commit()
+        db.executemany(_SQL_UPSERT_ITEM, [
+            (item.id, item.quote_id, item.category, item.description, item.quantity,
+             item.unit, item.unit_cost, item.total_cost)
+            for item in self.items
+        ])
+
+        # New rows get ascending ids in insertion order
+        new_items = [item for item in self.items if item.id is None]
+        if new_items:
+            cursor = db.execute(
+                "SELECT id FROM quote_items WHERE quote_id = ? ORDER BY id", (self.id,)
+            )
+            new_ids = [row[0] for row in cursor if row[0] not in existing]
+            for item, item_id in zip(new_items, new_ids):
+                item.id = item_id
 
     def delete(self):
         """Delete quote from database."""
         if self.id:
             db = get_db()
-            db.execute("DELETE FROM quote_items WHERE quote_id = ?", (self.id,))
-            db.execute("DELETE FROM quotes WHERE id = ?", (self.id,))
-            db.commit()
+            with db.connection:
+                db.execute("DELETE FROM quote_items WHERE quote_id = ?", (self.id,))
+                db.execute("DELETE FROM quotes WHERE id = ?", (self.id,))
 
     @classmethod
     def get_by_id(cls, quote_id: int) -> Optional['Quote']:
         """Get quote by ID."""
         db = get_db()
-        cursor = db.execute("SELECT * FROM quotes WHERE id = ?", (quote_id,))
+        cursor = db.execute(f"""
+            SELECT {_QUOTE_COLUMNS}, {Customer.JOINED_COLUMNS}
+            FROM quotes q
+            LEFT JOIN customers c ON c.id = q.customer_id
+            WHERE q.id = ?
+        """, (quote_id,))
         row = cursor.fetchone()
         if row:
             quote = cls._from_row(row)
+            quote.customer = Customer._from_joined_row(row)
             quote._load_items()
-            quote._load_customer()
             return quote
         return None
 
@@ -196,30 +286,74 @@ class Quote:
     def get_all(cls, status: str = None) -> List['Quote']:
         """Get all quotes, optionally filtered by status."""
         db = get_db()
+        query = f"""
+            SELECT {_QUOTE_COLUMNS}, {Customer.JOINED_COLUMNS}
+            FROM quotes q
+            LEFT JOIN customers c ON c.id = q.customer_id
+        """
         if status:
-            cursor = db.execute(
-                "SELECT * FROM quotes WHERE status = ? ORDER BY created_at DESC",
-                (status,)
-            )
+            cursor = db.execute(query + " WHERE q.status = ? ORDER BY q.created_at DESC", (status,))
         else:
-            cursor = db.execute("SELECT * FROM quotes ORDER BY created_at DESC")
+            cursor = db.execute(query + " ORDER BY q.created_at DESC")
 
+        # Quotes for the same customer share one Customer object
+        customers = {}
         quotes = []
-        for row in cursor.fetchall():
+        for row in cursor:
             quote = cls._from_row(row)
-            quote._load_customer()
+            if row['c_id'] is not None:
+                if row['c_id'] not in customers:
+                    customers[row['c_id']] = Customer._from_joined_row(row)
+                quote.customer = customers[row['c_id']]
             quotes.append(quote)
         return quotes
 
+    @classmethod
+    def get_all_rows(cls, status: str = None, limit: int = None, offset: int = 0) -> List[QuoteRow]:
+        """Get quote listing rows with customer names in a single query, newest first."""
+        db = get_db()
+        query = f"""
+            SELECT {_ROW_COLUMNS}
+            FROM quotes q
+            LEFT JOIN customers c ON c.id = q.customer_id
+        """
+        params = ()
+        if status:
+            query += " WHERE q.status = ?"
+            params = (status,)
+        # created_at has one-second resolution, so id keeps pages stable
+        query += " ORDER BY q.created_at DESC, q.id DESC"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params += (limit, offset)
+        return [QuoteRow(*row) for row in db.execute(query, params)]
+
     @classmethod
     def get_by_customer(cls, customer_id: int) -> List['Quote']:
         """Get all quotes for a customer."""
         db = get_db()
         cursor = db.execute(
-            "SELECT * FROM quotes WHERE customer_id = ? ORDER BY created_at DESC",
+            f"SELECT {_QUOTE_COLUMNS} FROM quotes q WHERE q.customer_id = ? ORDER BY q.created_at DESC",
             (customer_id,)
         )
-        return [cls._from_row(row) for row in cursor.fetchall()]
+        return [cls._from_row(row) for row in cursor]
+
+    @classmethod
+    def get_summary_by_customer(cls, customer_id: int, limit: int = 5) -> list:
+        """Get the most recent quotes for a customer as lightweight rows.
+
+        Each row has quote_number, total and status, plus quote_count with the
+        customer's total number of quotes.
+        """
+        db = get_db()
+        cursor = db.execute("""
+            SELECT quote_number, total, status, COUNT(*) OVER () AS quote_count
+            FROM quotes
+            WHERE customer_id = ?
+            ORDER BY created_at DESC
+            LIMIT ?
+        """, (customer_id, limit))
+        return cursor.fetchall()
 
     def _load_items(self):
         """Load line items for this quote."""
@@ -228,56 +362,40 @@ class Quote:
 
         db = get_db()
         cursor = db.execute(
-            "SELECT * FROM quote_items WHERE quote_id = ?",
+            f"SELECT {_ITEM_COLUMNS} FROM quote_items i WHERE i.quote_id = ?",
             (self.id,)
         )
-        self.items = [
-            QuoteItem(
-                id=row['id'],
-                quote_id=row['quote_id'],
-                category=row['category'],
-                description=row['description'],
-                quantity=row['quantity'],
-                unit=row['unit'],
-                unit_cost=row['unit_cost'],
-                total_cost=row['total_cost']
-            )
-            for row in cursor.fetchall()
-        ]
-
-    def _load_customer(self):
-        """Load customer for this quote."""
-        if self.customer_id:
-            self.customer = Customer.get_by_id(self.customer_id)
+        self.items = [QuoteItem._from_row(row) for row in cursor]
+        self._saved_items = self._items_signature()
 
     @classmethod
     def _from_row(cls, row) -> 'Quote':
-        """Create Quote from database row."""
-        return cls(
-            id=row['id'],
-            customer_id=row['customer_id'],
-            quote_number=row['quote_number'],
-            gate_type=row['gate_type'] or "swing",
-            gate_style=row['gate_style'] or "standard",
-            width=row['width'] or 12.0,
-            height=row['height'] or 6.0,
-            material=row['material'] or "steel",
-            automation=row['automation'] or "none",
-            access_control=row['access_control'] or "none",
-            ground_type=row['ground_type'] or "concrete",
-            slope=row['slope'] or "flat",
-            power_distance=row['power_distance'] or 0.0,
-            removal_needed=bool(row['removal_needed']),
-            labor_hours=row['labor_hours'] or 0.0,
-            labor_rate=row['labor_rate'] or 125.0,
-            materials_cost=row['materials_cost'] or 0.0,
-            markup_percent=row['markup_percent'] or 30.0,
-            tax_rate=row['tax_rate'] or 0.0,
-            subtotal=row['subtotal'] or 0.0,
-            tax_amount=row['tax_amount'] or 0.0,
-            total=row['total'] or 0.0,
-            status=row['status'] or "draft",
-            notes=row['notes'] or "",
-            created_at=row['created_at'],
-            updated_at=row['updated_at']
-        )
+        """Create Quote from a row whose leading columns are _QUOTE_COLUMNS."""
+        # Defaults are already applied by the COALESCEs in _QUOTE_COLUMNS
+        return cls(*row[:_REMOVAL_INDEX], bool(row[_REMOVAL_INDEX]),
+                   *row[_REMOVAL_INDEX + 1:len(cls._COLUMNS)])
+
+
+def _defaulted_column(name: str, default) -> str:
+    """Select q.<name>, substituting the field default for NULL and empty values."""
+    if default is None:
+        return f"q.{name}"
+    if isinstance(default, str):
+        literal, empty = f"'{default}'", "''"
+    else:
+        literal, empty = str(int(default) if isinstance(default, bool) else default), "0"
+    if not default:
+        return f"COALESCE(q.{name}, {literal})"
+    return f"COALESCE(NULLIF(q.{name}, {empty}), {literal})"
+
+
+_FIELD_DEFAULTS = {f.name: f.default for f in fields(Quote)}
+_QUOTE_COLUMNS = ", ".join(
+    _defaulted_column(column, _FIELD_DEFAULTS[column]) for column in Quote._COLUMNS
+)
+_REMOVAL_INDEX = Quote._COLUMNS.index('removal_needed')
+# QuoteRow columns, defaulted exactly as _QUOTE_COLUMNS does
+_ROW_COLUMNS = ", ".join(
+    "c.name" if f.name == 'customer_name' else _defaulted_column(f.name, _FIELD_DEFAULTS[f.name])
+    for f in fields(QuoteRow)
+)
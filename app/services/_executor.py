@@ -0,0 +1,7 @@
+"""Shared background worker pool for Gate Quote Pro."""
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gqpro")
+# Drop queued work on exit; running tasks are still joined by the interpreter
+atexit.register(executor.shutdown, wait=False, cancel_futures=True)
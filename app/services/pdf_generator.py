@@ -1,7 +1,13 @@
 """PDF quote generation service for Gate Quote Pro."""
+import hashlib
+import io
 import os
+import threading
+from collections import OrderedDict
+from dataclasses import astuple
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -12,13 +18,74 @@ from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
 from ..models.quote import Quote
 from ..models.database import get_db
 
+# Palette, parsed once
+_NAVY = colors.HexColor('#1a365d')
+_CHARCOAL = colors.HexColor('#2d3748')
+_SLATE = colors.HexColor('#4a5568')
+_GRAY = colors.HexColor('#718096')
+_HEADER_BG = colors.HexColor('#e2e8f0')
+_GRID = colors.HexColor('#cbd5e0')
+
+# Table styles are never modified once built, so every PDF shares them
+_SPECS_TS = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (-1, -1), _CHARCOAL),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+# Shared by the items and labor tables
+_GRID_TS = TableStyle([
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BACKGROUND', (0, 0), (-1, 0), _HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _NAVY),
+    ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ('GRID', (0, 0), (-1, -1), 0.5, _GRID),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+])
+
+_TOTALS_TS = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -2), 10),
+    ('FONTSIZE', (0, -1), (-1, -1), 12),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('TEXTCOLOR', (0, -1), (-1, -1), _NAVY),
+    ('LINEABOVE', (0, -1), (-1, -1), 1, _NAVY),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+])
+
+
+@lru_cache(maxsize=64)
+def _format_value(value: str) -> str:
+    """Format a value for display (capitalize, replace underscores)."""
+    if not value:
+        return "N/A"
+    return value.replace('_', ' ').title()
+
+
+# Settings shown in the company header
+HEADER_SETTINGS = ('company_name', 'company_address', 'company_phone', 'company_email', 'company_license')
+
 
 class PDFGenerator:
     """Generate professional PDF quotes."""
 
+    PDF_CACHE_SIZE = 16
+
     def __init__(self):
         self.styles = getSampleStyleSheet()
         self._setup_styles()
+        # Company header (text, style name) lines and the settings they came from
+        self._header_lines = (None, ())
+        # Recently rendered PDFs by input fingerprint, oldest first
+        self._pdf_cache = OrderedDict()
+        self._pdf_lock = threading.Lock()
 
     def _setup_styles(self):
         """Setup custom paragraph styles."""
@@ -26,7 +93,7 @@ class PDFGenerator:
             name='CompanyName',
             parent=self.styles['Heading1'],
             fontSize=24,
-            textColor=colors.HexColor('#1a365d'),
+            textColor=_NAVY,
             spaceAfter=6,
             alignment=TA_CENTER
         ))
@@ -35,7 +102,7 @@ class PDFGenerator:
             name='CompanyInfo',
             parent=self.styles['Normal'],
             fontSize=10,
-            textColor=colors.HexColor('#4a5568'),
+            textColor=_SLATE,
             alignment=TA_CENTER,
             spaceAfter=2
         ))
@@ -44,7 +111,7 @@ class PDFGenerator:
             name='QuoteTitle',
             parent=self.styles['Heading2'],
             fontSize=18,
-            textColor=colors.HexColor('#2d3748'),
+            textColor=_CHARCOAL,
             spaceBefore=20,
             spaceAfter=20,
             alignment=TA_CENTER
@@ -54,7 +121,7 @@ class PDFGenerator:
             name='SectionHeader',
             parent=self.styles['Heading3'],
             fontSize=12,
-            textColor=colors.HexColor('#1a365d'),
+            textColor=_NAVY,
             spaceBefore=15,
             spaceAfter=8,
             fontName='Helvetica-Bold'
@@ -64,7 +131,7 @@ class PDFGenerator:
             name='CustomerInfo',
             parent=self.styles['Normal'],
             fontSize=10,
-            textColor=colors.HexColor('#2d3748'),
+            textColor=_CHARCOAL,
             spaceAfter=2
         ))
 
@@ -72,7 +139,7 @@ class PDFGenerator:
             name='Terms',
             parent=self.styles['Normal'],
             fontSize=8,
-            textColor=colors.HexColor('#718096'),
+            textColor=_GRAY,
             spaceBefore=20
         ))
 
@@ -81,15 +148,12 @@ class PDFGenerator:
             parent=self.styles['Normal'],
             fontSize=14,
             fontName='Helvetica-Bold',
-            textColor=colors.HexColor('#1a365d'),
+            textColor=_NAVY,
             alignment=TA_RIGHT
         ))
 
     def generate(self, quote: Quote, output_path: str = None) -> str:
         """Generate PDF quote and return the file path."""
-        db = get_db()
-        settings = db.get_all_settings()
-
         # Determine output path
         if output_path is None:
             downloads = Path.home() / "Downloads"
@@ -97,9 +161,44 @@ class PDFGenerator:
             filename = f"Quote_{quote.quote_number}_{datetime.now().strftime('%Y%m%d')}.pdf"
             output_path = str(downloads / filename)
 
+        # Rendered in memory so the file is written with a single call
+        Path(output_path).write_bytes(self.generate_bytes(quote))
+        return output_path
+
+    def generate_bytes(self, quote: Quote) -> bytes:
+        """Generate PDF quote in memory and return its contents."""
+        settings = get_db().get_all_settings()
+        date_str = datetime.now().strftime('%B %d, %Y')
+
+        # Identical inputs render identical PDFs, so recent results are reused
+        key = self._fingerprint(quote, settings, date_str)
+        with self._pdf_lock:
+            pdf_data = self._pdf_cache.get(key)
+        if pdf_data is None:
+            pdf_data = self._render(quote, settings, date_str)
+            with self._pdf_lock:
+                self._pdf_cache[key] = pdf_data
+                if len(self._pdf_cache) > self.PDF_CACHE_SIZE:
+                    self._pdf_cache.popitem(last=False)
+        return pdf_data
+
+    def cache_key(self, quote: Quote) -> str:
+        """Get a key that changes whenever the PDF for this quote would change."""
+        settings = get_db().get_all_settings()
+        return self._fingerprint(quote, settings, datetime.now().strftime('%B %d, %Y'))
+
+    @staticmethod
+    def _fingerprint(quote: Quote, settings: dict, date_str: str) -> str:
+        """Hash everything a rendered PDF depends on."""
+        data = repr((astuple(quote), sorted(settings.items()), date_str))
+        return hashlib.sha1(data.encode()).hexdigest()
+
+    def _render(self, quote: Quote, settings: dict, date_str: str) -> bytes:
+        """Render the PDF for a quote."""
         # Create PDF
+        buffer = io.BytesIO()
         doc = SimpleDocTemplate(
-            output_path,
+            buffer,
             pagesize=letter,
             rightMargin=0.75 * inch,
             leftMargin=0.75 * inch,
@@ -107,31 +206,14 @@ class PDFGenerator:
             bottomMargin=0.5 * inch
         )
 
-        story = []
-
         # Company Header
-        story.append(Paragraph(settings.get('company_name', 'Your Gate Company'), self.styles['CompanyName']))
-
-        if settings.get('company_address'):
-            story.append(Paragraph(settings['company_address'], self.styles['CompanyInfo']))
-
-        contact_parts = []
-        if settings.get('company_phone'):
-            contact_parts.append(settings['company_phone'])
-        if settings.get('company_email'):
-            contact_parts.append(settings['company_email'])
-        if contact_parts:
-            story.append(Paragraph(' | '.join(contact_parts), self.styles['CompanyInfo']))
-
-        if settings.get('company_license'):
-            story.append(Paragraph(f"License: {settings['company_license']}", self.styles['CompanyInfo']))
+        story = self._header(settings)
 
         # Quote Title
         story.append(Spacer(1, 20))
         story.append(Paragraph(f"QUOTE #{quote.quote_number}", self.styles['QuoteTitle']))
 
         # Quote Date and Status
-        date_str = datetime.now().strftime('%B %d, %Y')
         story.append(Paragraph(f"Date: {date_str}", self.styles['CustomerInfo']))
         story.append(Paragraph(f"Status: {quote.status.upper()}", self.styles['CustomerInfo']))
 
@@ -155,21 +237,14 @@ class PDFGenerator:
         story.append(Paragraph("PROJECT SPECIFICATIONS", self.styles['SectionHeader']))
 
         specs_data = [
-            ['Gate Type:', self._format_value(quote.gate_type), 'Material:', self._format_value(quote.material)],
+            ['Gate Type:', _format_value(quote.gate_type), 'Material:', _format_value(quote.material)],
             ['Width:', f"{quote.width} ft", 'Height:', f"{quote.height} ft"],
-            ['Style:', self._format_value(quote.gate_style), 'Automation:', self._format_value(quote.automation)],
-            ['Access Control:', self._format_value(quote.access_control), 'Ground Type:', self._format_value(quote.ground_type)],
+            ['Style:', _format_value(quote.gate_style), 'Automation:', _format_value(quote.automation)],
+            ['Access Control:', _format_value(quote.access_control), 'Ground Type:', _format_value(quote.ground_type)],
         ]
 
         specs_table = Table(specs_data, colWidths=[1.5 * inch, 2 * inch, 1.5 * inch, 2 * inch])
-        specs_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2d3748')),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        specs_table.setStyle(_SPECS_TS)
         story.append(specs_table)
 
         # Materials/Line Items
@@ -177,27 +252,17 @@ class PDFGenerator:
             story.append(Spacer(1, 15))
             story.append(Paragraph("MATERIALS & EQUIPMENT", self.styles['SectionHeader']))
 
-            items_data = [['Description', 'Qty', 'Unit', 'Unit Price', 'Total']]
-            for item in quote.items:
-                items_data.append([
-                    item.description,
-                    f"{item.quantity:.1f}",
-                    item.unit,
-                    f"${item.unit_cost:.2f}",
-                    f"${item.total_cost:.2f}"
-                ])
+            format_money = "${:.2f}".format
+            format_qty = "{:.1f}".format
+            items_data = [('Description', 'Qty', 'Unit', 'Unit Price', 'Total')]
+            items_data.extend(
+                (item.description, format_qty(item.quantity), item.unit,
+                 format_money(item.unit_cost), format_money(item.total_cost))
+                for item in quote.items
+            )
 
             items_table = Table(items_data, colWidths=[3 * inch, 0.6 * inch, 0.6 * inch, 1 * inch, 1 * inch])
-            items_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e2e8f0')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
-                ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cbd5e0')),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ]))
+            items_table.setStyle(_GRID_TS)
             story.append(items_table)
 
         # Labor
@@ -211,16 +276,7 @@ class PDFGenerator:
         ]
 
         labor_table = Table(labor_data, colWidths=[3.6 * inch, 1 * inch, 1.2 * inch, 1 * inch])
-        labor_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e2e8f0')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
-            ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cbd5e0')),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        labor_table.setStyle(_GRID_TS)
         story.append(labor_table)
 
         # Totals
@@ -240,17 +296,7 @@ class PDFGenerator:
         totals_data.append(['TOTAL:', f"${quote.total:.2f}"])
 
         totals_table = Table(totals_data, colWidths=[5 * inch, 1.5 * inch])
-        totals_table.setStyle(TableStyle([
-            ('FONTSIZE', (0, 0), (-1, -2), 10),
-            ('FONTSIZE', (0, -1), (-1, -1), 12),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('TEXTCOLOR', (0, -1), (-1, -1), colors.HexColor('#1a365d')),
-            ('LINEABOVE', (0, -1), (-1, -1), 1, colors.HexColor('#1a365d')),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ]))
+        totals_table.setStyle(_TOTALS_TS)
         story.append(totals_table)
 
         # Notes
@@ -268,13 +314,40 @@ class PDFGenerator:
         # Build PDF
         doc.build(story)
 
-        return output_path
+        return buffer.getvalue()
+
+    def _header(self, settings: dict) -> list:
+        """Build fresh company header paragraphs from the cached header lines."""
+        # Paragraphs are mutated while a document lays them out, so renders
+        # running on other threads must never share them
+        key = tuple(settings.get(name) for name in HEADER_SETTINGS)
+        cached_key, lines = self._header_lines
+        if key != cached_key:
+            lines = self._build_header_lines(settings)
+            # Swapped in as one tuple so readers never see a mismatched pair
+            self._header_lines = (key, lines)
+        return [Paragraph(text, self.styles[style]) for text, style in lines]
+
+    @staticmethod
+    def _build_header_lines(settings: dict) -> tuple:
+        """Build the company header as (text, style name) pairs."""
+        lines = [(settings.get('company_name', 'Your Gate Company'), 'CompanyName')]
+
+        if settings.get('company_address'):
+            lines.append((settings['company_address'], 'CompanyInfo'))
+
+        contact_parts = []
+        if settings.get('company_phone'):
+            contact_parts.append(settings['company_phone'])
+        if settings.get('company_email'):
+            contact_parts.append(settings['company_email'])
+        if contact_parts:
+            lines.append((' | '.join(contact_parts), 'CompanyInfo'))
+
+        if settings.get('company_license'):
+            lines.append((f"License: {settings['company_license']}", 'CompanyInfo'))
 
-    def _format_value(self, value: str) -> str:
-        """Format a value for display (capitalize, replace underscores)."""
-        if not value:
-            return "N/A"
-        return value.replace('_', ' ').title()
+        return tuple(lines)
 
 
 # Global generator instance
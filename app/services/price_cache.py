@@ -0,0 +1,38 @@
+"""Persistent supplier price cache for Gate Quote Pro."""
+import json
+import time
+from typing import Optional
+
+from ..models.database import get_db
+
+
+def get(url: str) -> Optional[dict]:
+    """Get the stored price payload for a URL, or None if there is none."""
+    db = get_db()
+    cursor = db.execute("SELECT payload FROM price_cache WHERE url = ?", (url,))
+    row = cursor.fetchone()
+    return json.loads(row['payload']) if row else None
+
+
+def put(url: str, payload: dict):
+    """Store a price payload for a URL."""
+    db = get_db()
+    db.execute(
+        "INSERT OR REPLACE INTO price_cache (url, ts, payload) VALUES (?, ?, ?)",
+        (url, int(time.time()), json.dumps(payload))
+    )
+    db.commit()
+
+
+def invalidate(url: str):
+    """Remove a stored price so the next lookup refetches it."""
+    db = get_db()
+    db.execute("DELETE FROM price_cache WHERE url = ?", (url,))
+    db.commit()
+
+
+def clear():
+    """Remove every stored price."""
+    db = get_db()
+    db.execute("DELETE FROM price_cache")
+    db.commit()
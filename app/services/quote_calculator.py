@@ -1,9 +1,14 @@
 """Quote calculation service for Gate Quote Pro."""
-from typing import List, Tuple
+import math
+from bisect import bisect_left
+from typing import List
 from ..models.quote import Quote, QuoteItem
 from ..models.materials import Material
 from ..models.database import get_db
 
+# Gate types that need a track system and a third post, and those hung on hinges
+TRACK_GATE_TYPES = frozenset({'sliding', 'cantilever'})
+HINGED_GATE_TYPES = frozenset({'swing', 'bi-fold'})
 
 class QuoteCalculator:
     """Service to calculate labor hours and costs for gate installations."""
@@ -28,6 +33,11 @@ class QuoteCalculator:
         'over_10': 1.6
     }
 
+    # Height band index is the number of breaks below the height (bisect_left);
+    # the first break sits just under 5ft so that exactly 5ft counts as '5_to_7'
+    _HEIGHT_BREAKS = (math.nextafter(5.0, 0.0), 7.0, 10.0)
+    _HEIGHT_MULTS = tuple(HEIGHT_MULTIPLIER.values())
+
     # Material complexity factor
     MATERIAL_FACTOR = {
         'chain_link': 0.7,
@@ -80,43 +90,19 @@ class QuoteCalculator:
 
     def calculate_labor_hours(self, quote: Quote) -> float:
         """Calculate estimated labor hours for a quote."""
-        # Base hours from gate type
+        # Base hours from gate type, plus time for gates over 10ft wide
         base_hours = self.GATE_TYPE_HOURS.get(quote.gate_type, 4.0)
-
-        # Width adjustment (add time for gates over 10ft)
-        if quote.width > 10:
-            base_hours += (quote.width - 10) * self.WIDTH_FACTOR
-
-        # Height multiplier
-        if quote.height < 5:
-            height_mult = self.HEIGHT_MULTIPLIER['under_5']
-        elif quote.height <= 7:
-            height_mult = self.HEIGHT_MULTIPLIER['5_to_7']
-        elif quote.height <= 10:
-            height_mult = self.HEIGHT_MULTIPLIER['7_to_10']
-        else:
-            height_mult = self.HEIGHT_MULTIPLIER['over_10']
-
-        # Material factor
-        material_fact = self.MATERIAL_FACTOR.get(quote.material, 1.0)
-
-        # Style factor
-        style_fact = self.STYLE_FACTOR.get(quote.gate_style, 1.0)
-
-        # Ground condition factor
-        ground_fact = self.GROUND_FACTOR.get(quote.ground_type, 1.0)
-
-        # Slope factor
-        slope_fact = self.SLOPE_FACTOR.get(quote.slope, 1.0)
-
-        # Calculate gate installation hours
-        gate_hours = base_hours * height_mult * material_fact * style_fact * ground_fact * slope_fact
-
-        # Add automation hours
-        auto_hours = self.AUTOMATION_HOURS.get(quote.automation, 0.0)
-
-        # Add access control hours
-        access_hours = self.ACCESS_CONTROL_HOURS.get(quote.access_control, 0.0)
+        base_hours += max(0.0, quote.width - 10) * self.WIDTH_FACTOR
+
+        # Gate installation hours scaled by height, material, style, ground and slope
+        gate_hours = (
+            base_hours
+            * self._HEIGHT_MULTS[bisect_left(self._HEIGHT_BREAKS, quote.height)]
+            * self.MATERIAL_FACTOR.get(quote.material, 1.0)
+            * self.STYLE_FACTOR.get(quote.gate_style, 1.0)
+            * self.GROUND_FACTOR.get(quote.ground_type, 1.0)
+            * self.SLOPE_FACTOR.get(quote.slope, 1.0)
+        )
 
         # Add electrical run time (0.1 hours per foot from power)
         electrical_hours = quote.power_distance * 0.1 if quote.automation != 'none' else 0.0
@@ -124,19 +110,20 @@ class QuoteCalculator:
         # Add removal hours if needed
         removal_hours = 2.0 if quote.removal_needed else 0.0
 
-        # Total hours
-        total_hours = gate_hours + auto_hours + access_hours + electrical_hours + removal_hours
+        # Total hours, including automation and access control installation
+        total_hours = (gate_hours + self.AUTOMATION_HOURS.get(quote.automation, 0.0)
+                       + self.ACCESS_CONTROL_HOURS.get(quote.access_control, 0.0)
+                       + electrical_hours + removal_hours)
 
         # Round to nearest quarter hour
         return round(total_hours * 4) / 4
 
     def suggest_materials(self, quote: Quote) -> List[QuoteItem]:
         """Suggest materials based on quote specifications."""
+        # First matching material for each keyword, in price list order
+        index = Material.get_keyword_index()
         items = []
 
-        # Get all available materials
-        all_materials = {m.name.lower(): m for m in Material.get_all()}
-
         # Gate panel cost (based on material and size)
         gate_area = quote.width * quote.height
         material_names = {
@@ -148,86 +135,54 @@ class QuoteCalculator:
         }
 
         gate_name = material_names.get(quote.material, 'steel swing gate panel')
-        for name, material in all_materials.items():
-            if gate_name in name.lower():
-                item = QuoteItem(
-                    category='gates',
-                    description=material.name,
-                    quantity=quote.width,
-                    unit=material.unit,
-                    unit_cost=material.cost
-                )
-                item.calculate_total()
-                items.append(item)
-                break
+        material = index.get(gate_name)
+        if material:
+            item = QuoteItem(
+                category='gates',
+                description=material.name,
+                quantity=quote.width,
+                unit=material.unit,
+                unit_cost=material.cost
+            )
+            item.calculate_total()
+            items.append(item)
 
         # Add posts (2 for swing gate, more for sliding)
-        post_count = 2
-        if quote.gate_type in ['sliding', 'cantilever']:
-            post_count = 3
+        post_count = 3 if quote.gate_type in TRACK_GATE_TYPES else 2
+
+        material = index.get('post 6x6')
+        if material:
+            post_length = quote.height + 2  # Posts buried 2ft
+            item = QuoteItem(
+                category='hardware',
+                description=f"{material.name} x {post_count} posts",
+                quantity=post_length * post_count,
+                unit='ft',
+                unit_cost=material.cost
+            )
+            item.calculate_total()
+            items.append(item)
 
-        for name, material in all_materials.items():
-            if 'post 6x6' in name.lower():
-                post_length = quote.height + 2  # Posts buried 2ft
+        # Add hinges for swing gates
+        if quote.gate_type in HINGED_GATE_TYPES:
+            material = index.get('heavy duty hinges')
+            if material:
                 item = QuoteItem(
                     category='hardware',
-                    description=f"{material.name} x {post_count} posts",
-                    quantity=post_length * post_count,
-                    unit='ft',
+                    description=material.name,
+                    quantity=2 if quote.gate_type == 'swing' else 4,
+                    unit='pair',
                     unit_cost=material.cost
                 )
                 item.calculate_total()
                 items.append(item)
-                break
-
-        # Add hinges for swing gates
-        if quote.gate_type in ['swing', 'bi-fold']:
-            for name, material in all_materials.items():
-                if 'heavy duty hinges' in name.lower():
-                    item = QuoteItem(
-                        category='hardware',
-                        description=material.name,
-                        quantity=2 if quote.gate_type == 'swing' else 4,
-                        unit='pair',
-                        unit_cost=material.cost
-                    )
-                    item.calculate_total()
-                    items.append(item)
-                    break
 
         # Add track system for sliding/cantilever
-        if quote.gate_type == 'cantilever':
-            for name, material in all_materials.items():
-                if 'cantilever' in name.lower():
-                    item = QuoteItem(
-                        category='gates',
-                        description=material.name,
-                        quantity=1,
-                        unit='each',
-                        unit_cost=material.cost
-                    )
-                    item.calculate_total()
-                    items.append(item)
-                    break
-        elif quote.gate_type == 'sliding':
-            for name, material in all_materials.items():
-                if 'v-track' in name.lower():
-                    item = QuoteItem(
-                        category='gates',
-                        description=material.name,
-                        quantity=1,
-                        unit='each',
-                        unit_cost=material.cost
-                    )
-                    item.calculate_total()
-                    items.append(item)
-                    break
-
-        # Add latch
-        for name, material in all_materials.items():
-            if 'gate latch - heavy duty' in name.lower():
+        if quote.gate_type in TRACK_GATE_TYPES:
+            material = index.get('cantilever' if quote.gate_type == 'cantilever' else 'v-track')
+            if material:
                 item = QuoteItem(
-                    category='hardware',
+                    category='gates',
                     description=material.name,
                     quantity=1,
                     unit='each',
@@ -235,7 +190,19 @@ class QuoteCalculator:
                 )
                 item.calculate_total()
                 items.append(item)
-                break
+
+        # Add latch
+        material = index.get('gate latch - heavy duty')
+        if material:
+            item = QuoteItem(
+                category='hardware',
+                description=material.name,
+                quantity=1,
+                unit='each',
+                unit_cost=material.cost
+            )
+            item.calculate_total()
+            items.append(item)
 
         # Add automation if selected
         automation_items = {
@@ -245,33 +212,30 @@ class QuoteCalculator:
         }
 
         if quote.automation != 'none':
-            search_term = automation_items.get(quote.automation, '')
-            for name, material in all_materials.items():
-                if search_term in name.lower():
-                    item = QuoteItem(
-                        category='operators',
-                        description=material.name,
-                        quantity=1 if quote.automation != 'dual_swing' else 1,
-                        unit='each',
-                        unit_cost=material.cost
-                    )
-                    item.calculate_total()
-                    items.append(item)
-                    break
+            material = index.get(automation_items.get(quote.automation))
+            if material:
+                item = QuoteItem(
+                    category='operators',
+                    description=material.name,
+                    quantity=1,
+                    unit='each',
+                    unit_cost=material.cost
+                )
+                item.calculate_total()
+                items.append(item)
 
             # Add safety photoeyes for automated gates
-            for name, material in all_materials.items():
-                if 'safety photoeye' in name.lower():
-                    item = QuoteItem(
-                        category='access_control',
-                        description=material.name,
-                        quantity=1,
-                        unit='pair',
-                        unit_cost=material.cost
-                    )
-                    item.calculate_total()
-                    items.append(item)
-                    break
+            material = index.get('safety photoeye')
+            if material:
+                item = QuoteItem(
+                    category='access_control',
+                    description=material.name,
+                    quantity=1,
+                    unit='pair',
+                    unit_cost=material.cost
+                )
+                item.calculate_total()
+                items.append(item)
 
         # Add access control if selected
         access_items = {
@@ -282,37 +246,23 @@ class QuoteCalculator:
         }
 
         if quote.access_control != 'none':
-            search_term = access_items.get(quote.access_control, '')
-            for name, material in all_materials.items():
-                if search_term in name.lower():
-                    item = QuoteItem(
-                        category='access_control',
-                        description=material.name,
-                        quantity=1,
-                        unit='each',
-                        unit_cost=material.cost
-                    )
-                    item.calculate_total()
-                    items.append(item)
-                    break
+            material = index.get(access_items.get(quote.access_control))
+            if material:
+                item = QuoteItem(
+                    category='access_control',
+                    description=material.name,
+                    quantity=1,
+                    unit='each',
+                    unit_cost=material.cost
+                )
+                item.calculate_total()
+                items.append(item)
 
         # Add electrical if automation is used
         if quote.automation != 'none' and quote.power_distance > 0:
-            for name, material in all_materials.items():
-                if 'electrical wire' in name.lower():
-                    item = QuoteItem(
-                        category='electrical',
-                        description=material.name,
-                        quantity=quote.power_distance,
-                        unit='ft',
-                        unit_cost=material.cost
-                    )
-                    item.calculate_total()
-                    items.append(item)
-                    break
-
-            for name, material in all_materials.items():
-                if 'conduit' in name.lower():
+            for keyword in ('electrical wire', 'conduit'):
+                material = index.get(keyword)
+                if material:
                     item = QuoteItem(
                         category='electrical',
                         description=material.name,
@@ -322,38 +272,34 @@ class QuoteCalculator:
                     )
                     item.calculate_total()
                     items.append(item)
-                    break
 
         # Add concrete for posts
         bags_per_post = 4  # About 4 bags per post hole
-        post_count = 2 if quote.gate_type in ['swing', 'bi-fold', 'pedestrian'] else 3
-        for name, material in all_materials.items():
-            if 'concrete' in name.lower() and 'bag' in material.unit.lower():
+        material = index.get('concrete')
+        if material:
+            item = QuoteItem(
+                category='hardware',
+                description=material.name,
+                quantity=bags_per_post * post_count,
+                unit='bag',
+                unit_cost=material.cost
+            )
+            item.calculate_total()
+            items.append(item)
+
+        # Add removal if needed
+        if quote.removal_needed:
+            material = index.get('existing gate removal')
+            if material:
                 item = QuoteItem(
-                    category='hardware',
+                    category='misc',
                     description=material.name,
-                    quantity=bags_per_post * post_count,
-                    unit='bag',
+                    quantity=1,
+                    unit='each',
                     unit_cost=material.cost
                 )
                 item.calculate_total()
                 items.append(item)
-                break
-
-        # Add removal if needed
-        if quote.removal_needed:
-            for name, material in all_materials.items():
-                if 'existing gate removal' in name.lower():
-                    item = QuoteItem(
-                        category='misc',
-                        description=material.name,
-                        quantity=1,
-                        unit='each',
-                        unit_cost=material.cost
-                    )
-                    item.calculate_total()
-                    items.append(item)
-                    break
 
         return items
 
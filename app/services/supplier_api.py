@@ -1,12 +1,64 @@
 """Supplier price checking service for Gate Quote Pro."""
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, List, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
+from urllib.parse import quote_plus
 import json
 import threading
+from collections import OrderedDict
+
+from . import price_cache
+from ._executor import executor
+
+
+# Class-name matchers for price and product title elements
+_PRICE_CLASS_RE = re.compile(r'price', re.I)
+_PRODUCT_CLASS_RE = re.compile(r'product', re.I)
+
+# Price patterns in order of preference (e.g., $123.45, 123.45, USD 123)
+_PRICE_PATTERNS = (
+    re.compile(r'\$\s*(\d+\.?\d*)'),
+    re.compile(r'(\d+\.\d{2})'),
+    re.compile(r'USD\s*(\d+\.?\d*)'),
+)
+
+# JSON-LD blocks embedded in product pages
+_JSON_LD_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.S | re.I
+)
+
+
+def _find_priced_product(data) -> Optional[Tuple[str, float]]:
+    """Find the first schema.org Product with an offer price, returning (name, price)."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        types = node.get('@type')
+        if types == 'Product' or (isinstance(types, list) and 'Product' in types):
+            offers = node.get('offers')
+            for offer in offers if isinstance(offers, list) else [offers]:
+                if not isinstance(offer, dict):
+                    continue
+                try:
+                    price = float(str(offer.get('price', offer.get('lowPrice'))).replace(',', ''))
+                except ValueError:
+                    continue
+                if price > 0:
+                    return str(node.get('name') or ''), price
+
+        stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+    return None
 
 
 @dataclass
@@ -51,9 +103,23 @@ class SupplierAPI:
         }
     }
 
-    # Price cache (url -> PriceResult)
-    _cache: Dict[str, PriceResult] = {}
-    _cache_duration = timedelta(hours=1)
+    # In-memory front for the persistent price_cache (url -> PriceResult),
+    # least recently used first
+    _cache: 'OrderedDict[str, PriceResult]' = OrderedDict()
+    _cache_lock = threading.Lock()
+    CACHE_SIZE = 4096
+
+    # How long a fetched price stays fresh, by supplier name
+    DEFAULT_TTL = timedelta(hours=1)
+    SUPPLIER_TTL = {
+        'Home Depot': timedelta(hours=6),
+    }
+
+    # URLs with a background refresh in flight
+    _refreshing = set()
+
+    # Concurrent fetches per compare_prices call
+    MAX_WORKERS = 8
 
     def __init__(self):
         self.session = requests.Session()
@@ -62,37 +128,77 @@ class SupplierAPI:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         })
+        # Keep enough pooled connections for the parallel fetches in compare_prices
+        adapter = HTTPAdapter(pool_connections=self.MAX_WORKERS, pool_maxsize=2 * self.MAX_WORKERS)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def get_price_from_url(self, url: str) -> Optional[PriceResult]:
         """Fetch price from a specific product URL."""
-        # Check cache first
-        if url in self._cache:
-            cached = self._cache[url]
-            if datetime.now() - cached.last_checked < self._cache_duration:
+        # Check the memory cache, then the persistent one
+        with self._cache_lock:
+            cached = self._cache.get(url)
+            if cached is not None:
+                self._cache.move_to_end(url)
+        if cached is None:
+            payload = price_cache.get(url)
+            if payload is not None:
+                payload['last_checked'] = datetime.fromisoformat(payload['last_checked'])
+                cached = PriceResult(**payload)
+                self._remember(url, cached)
+
+        if cached is not None:
+            ttl = self.SUPPLIER_TTL.get(cached.supplier, self.DEFAULT_TTL)
+            age = datetime.now() - cached.last_checked
+            if age < ttl:
+                # Past half its lifetime, serve it but refresh it in the background
+                if age >= ttl / 2:
+                    self._refresh_in_background(url)
                 return cached
 
+        return self._fetch_price(url)
+
+    def _remember(self, url: str, result: PriceResult):
+        """Put a price in the memory cache, evicting the least recently used."""
+        with self._cache_lock:
+            self._cache[url] = result
+            self._cache.move_to_end(url)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _refresh_in_background(self, url: str):
+        """Refetch a cached price on the shared worker pool, once at a time per URL."""
+        with self._cache_lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+
+        def done(_future):
+            with self._cache_lock:
+                self._refreshing.discard(url)
+
+        executor.submit(self._fetch_price, url).add_done_callback(done)
+
+    def _fetch_price(self, url: str) -> Optional[PriceResult]:
+        """Download and parse a product page, caching the price found."""
         try:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Determine supplier and extract price
-            result = None
+            # Without a declared charset, decode as UTF-8 rather than guessing with chardet
+            if 'charset' not in response.headers.get('Content-Type', '').lower():
+                response.encoding = 'utf-8'
 
-            if 'homedepot.com' in url:
-                result = self._parse_homedepot(soup, url)
-            elif 'lowes.com' in url:
-                result = self._parse_lowes(soup, url)
-            elif 'tractorsupply.com' in url:
-                result = self._parse_tractorsupply(soup, url)
-            elif 'walmart.com' in url:
-                result = self._parse_walmart(soup, url)
-            else:
-                result = self._parse_generic(soup, url)
+            # Structured product data is far cheaper to read than the whole page
+            result = self._parse_json_ld(response.text, url)
+            if not result:
+                result = self._parse_html(response.text, url)
 
             if result:
-                self._cache[url] = result
+                self._remember(url, result)
+                payload = asdict(result)
+                payload['last_checked'] = result.last_checked.isoformat()
+                price_cache.put(url, payload)
 
             return result
 
@@ -100,18 +206,66 @@ class SupplierAPI:
             print(f"Error fetching price from {url}: {e}")
             return None
 
+    def invalidate(self, url: str):
+        """Forget a cached price so the next check refetches it."""
+        with self._cache_lock:
+            self._cache.pop(url, None)
+        price_cache.invalidate(url)
+
+    def _parse_html(self, html: str, url: str) -> Optional[PriceResult]:
+        """Parse a product page with the supplier's HTML parser."""
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Determine supplier and extract price
+        if 'homedepot.com' in url:
+            return self._parse_homedepot(soup, url)
+        elif 'lowes.com' in url:
+            return self._parse_lowes(soup, url)
+        elif 'tractorsupply.com' in url:
+            return self._parse_tractorsupply(soup, url)
+        elif 'walmart.com' in url:
+            return self._parse_walmart(soup, url)
+        return self._parse_generic(soup, url)
+
+    def _parse_json_ld(self, html: str, url: str) -> Optional[PriceResult]:
+        """Read the price from a page's JSON-LD Product data, if it has any."""
+        for match in _JSON_LD_RE.finditer(html):
+            try:
+                data = json.loads(match.group(1))
+            except ValueError:
+                continue
+
+            product = _find_priced_product(data)
+            if product:
+                name, price = product
+                return PriceResult(
+                    supplier=self._supplier_name(url),
+                    product_name=(name or 'Product')[:100],
+                    price=price,
+                    url=url
+                )
+        return None
+
+    def _supplier_name(self, url: str) -> str:
+        """Get the display name of the supplier a URL belongs to."""
+        for key, info in self.SUPPLIERS.items():
+            if f"{key}.com" in url:
+                return info['name']
+        from urllib.parse import urlparse
+        return urlparse(url).netloc.replace('www.', '')
+
     def _parse_homedepot(self, soup: BeautifulSoup, url: str) -> Optional[PriceResult]:
         """Parse Home Depot product page."""
         try:
             # Try to find price
-            price_elem = soup.find('span', {'class': re.compile(r'price', re.I)})
+            price_elem = soup.find('span', {'class': _PRICE_CLASS_RE})
             if not price_elem:
                 price_elem = soup.find('div', {'data-price': True})
 
             price = self._extract_price(price_elem.get_text() if price_elem else '')
 
             # Try to find product name
-            title_elem = soup.find('h1', {'class': re.compile(r'product', re.I)})
+            title_elem = soup.find('h1', {'class': _PRODUCT_CLASS_RE})
             if not title_elem:
                 title_elem = soup.find('h1')
 
@@ -131,7 +285,7 @@ class SupplierAPI:
     def _parse_lowes(self, soup: BeautifulSoup, url: str) -> Optional[PriceResult]:
         """Parse Lowe's product page."""
         try:
-            price_elem = soup.find('span', {'class': re.compile(r'price', re.I)})
+            price_elem = soup.find('span', {'class': _PRICE_CLASS_RE})
             price = self._extract_price(price_elem.get_text() if price_elem else '')
 
             title_elem = soup.find('h1')
@@ -151,7 +305,7 @@ class SupplierAPI:
     def _parse_tractorsupply(self, soup: BeautifulSoup, url: str) -> Optional[PriceResult]:
         """Parse Tractor Supply product page."""
         try:
-            price_elem = soup.find('span', {'class': re.compile(r'price', re.I)})
+            price_elem = soup.find('span', {'class': _PRICE_CLASS_RE})
             price = self._extract_price(price_elem.get_text() if price_elem else '')
 
             title_elem = soup.find('h1')
@@ -173,7 +327,7 @@ class SupplierAPI:
         try:
             price_elem = soup.find('span', {'itemprop': 'price'})
             if not price_elem:
-                price_elem = soup.find('span', {'class': re.compile(r'price', re.I)})
+                price_elem = soup.find('span', {'class': _PRICE_CLASS_RE})
 
             price = self._extract_price(price_elem.get_text() if price_elem else '')
 
@@ -196,8 +350,8 @@ class SupplierAPI:
         try:
             # Look for common price patterns
             price_patterns = [
-                soup.find('span', {'class': re.compile(r'price', re.I)}),
-                soup.find('div', {'class': re.compile(r'price', re.I)}),
+                soup.find('span', {'class': _PRICE_CLASS_RE}),
+                soup.find('div', {'class': _PRICE_CLASS_RE}),
                 soup.find('span', {'itemprop': 'price'}),
                 soup.find('meta', {'property': 'product:price:amount'}),
             ]
@@ -236,15 +390,8 @@ class SupplierAPI:
         # Remove common non-price text
         text = text.replace(',', '')
 
-        # Find price pattern (e.g., $123.45, 123.45, $123)
-        patterns = [
-            r'\$\s*(\d+\.?\d*)',
-            r'(\d+\.\d{2})',
-            r'USD\s*(\d+\.?\d*)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _PRICE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     return float(match.group(1))
@@ -264,7 +411,7 @@ class SupplierAPI:
                 continue
 
             info = self.SUPPLIERS[sup]
-            search_url = info['search_url'].format(query=query.replace(' ', '+'))
+            search_url = info['search_url'].format(query=quote_plus(query))
 
             # Note: Full search would require JavaScript rendering
             # For now, return the search URL for manual lookup
@@ -279,7 +426,7 @@ class SupplierAPI:
 
     def get_search_urls(self, product_name: str) -> Dict[str, str]:
         """Get search URLs for a product across all suppliers."""
-        query = product_name.replace(' ', '+')
+        query = quote_plus(product_name)
         return {
             info['name']: info['search_url'].format(query=query)
             for info in self.SUPPLIERS.values()
@@ -293,24 +440,23 @@ class SupplierAPI:
             callback: Optional callback function(result) called as each price is fetched
         """
         results = []
+        if not urls:
+            return results
 
-        def fetch_price(url):
-            result = self.get_price_from_url(url)
-            if result:
-                results.append(result)
-                if callback:
-                    callback(result)
-
-        # Fetch prices in parallel
-        threads = []
-        for url in urls:
-            thread = threading.Thread(target=fetch_price, args=(url,))
-            thread.start()
-            threads.append(thread)
-
-        # Wait for all threads
-        for thread in threads:
-            thread.join(timeout=15)
+        # Fetch prices in parallel on a bounded pool, collecting them as they finish
+        pool = ThreadPoolExecutor(max_workers=min(len(urls), self.MAX_WORKERS))
+        futures = [pool.submit(self.get_price_from_url, url) for url in urls]
+        try:
+            for future in as_completed(futures, timeout=15):
+                result = future.result()
+                if result:
+                    results.append(result)
+                    if callback:
+                        callback(result)
+        except FuturesTimeout:
+            pass  # Report the prices that arrived in time
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
         # Sort by price
         results.sort(key=lambda x: x.price)
@@ -319,7 +465,9 @@ class SupplierAPI:
 
     def clear_cache(self):
         """Clear the price cache."""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
+        price_cache.clear()
 
 
 # Global instance
@@ -1,22 +1,31 @@
 """Configuration utilities for Gate Quote Pro."""
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_app_data_dir() -> Path:
-    """Get the application data directory."""
-    app_dir = Path.home() / "Library" / "Application Support" / "GateQuotePro"
+    """Get the application data directory for this platform."""
+    if sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    elif sys.platform == "win32":
+        base = Path(os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming")
+    else:
+        base = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    app_dir = base / "GateQuotePro"
     app_dir.mkdir(parents=True, exist_ok=True)
     return app_dir
 
 
+@lru_cache(maxsize=1)
 def get_resources_dir() -> Path:
     """Get the resources directory."""
     # Check if running from app bundle
-    if hasattr(__file__, '__file__'):
-        bundle_resources = Path(__file__).parent.parent.parent / "resources"
-        if bundle_resources.exists():
-            return bundle_resources
+    bundle_resources = Path(__file__).resolve().parent.parent.parent / "resources"
+    if bundle_resources.exists():
+        return bundle_resources
 
     # Check relative to home
     home_resources = Path.home() / "GateQuotePro" / "resources"
@@ -29,6 +38,7 @@ def get_resources_dir() -> Path:
     return resources
 
 
+@lru_cache(maxsize=1)
 def get_default_prices_path() -> str:
     """Get path to default prices JSON file."""
     return str(get_resources_dir() / "default_prices.json")
@@ -0,0 +1,20 @@
+"""Operating system helpers for Gate Quote Pro."""
+import os
+import subprocess
+import sys
+
+
+def open_file(path: str):
+    """Open a file with the system's default application without blocking."""
+    if sys.platform == "win32":
+        os.startfile(path)
+        return
+
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    subprocess.Popen(
+        [opener, path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True
+    )
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Gate Quote Pro - Web Application"""
 
+import gzip
+import io
 import os
 import sys
 import json
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
 from flask import Flask, render_template, request, jsonify, send_file
@@ -18,9 +22,8 @@ if app_dir not in sys.path:
 from app.models.database import get_db
 from app.models.customer import Customer
 from app.models.quote import Quote, QuoteItem
-from app.models.materials import Material
+from app.models.materials import Material, get_materials_version
 from app.services.quote_calculator import get_calculator
-from app.services.pdf_generator import get_pdf_generator
 from app.services.supplier_api import get_supplier_api
 
 # Initialize Flask app
@@ -28,6 +31,8 @@ flask_app = Flask(__name__,
     template_folder='templates',
     static_folder='static'
 )
+# Responses keep the field order they are built in; sorting every key is wasted work
+flask_app.json.sort_keys = False
 CORS(flask_app)
 
 # Initialize database and load defaults on startup
@@ -37,6 +42,35 @@ def init_app():
 
 init_app()
 
+# Smallest JSON body worth gzipping
+COMPRESS_MIN_SIZE = 1024
+
+@flask_app.after_request
+def compress_response(response):
+    """Gzip larger JSON responses for clients that accept it."""
+    if (response.mimetype != 'application/json' or response.status_code != 200
+            or response.direct_passthrough or 'Content-Encoding' in response.headers
+            or not request.accept_encodings['gzip']):
+        return response
+
+    data = response.get_data()
+    if len(data) >= COMPRESS_MIN_SIZE:
+        response.set_data(gzip.compress(data, compresslevel=5))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+    return response
+
+# Largest page the list endpoints return when ?limit= is given
+MAX_PAGE_SIZE = 500
+
+def _page_args():
+    """Read the optional ?limit=&offset= paging arguments; limit is None when absent."""
+    limit = request.args.get('limit', type=int)
+    if limit is None:
+        return None, 0
+    offset = request.args.get('offset', 0, type=int)
+    return max(0, min(limit, MAX_PAGE_SIZE)), max(0, offset)
+
 # ============== Pages ==============
 
 @flask_app.route('/')
@@ -48,25 +82,15 @@ def index():
 @flask_app.route('/api/customers', methods=['GET'])
 def get_customers():
     search = request.args.get('search', '')
-    if search:
-        customers = Customer.search(search)
-    else:
-        customers = Customer.get_all()
-    return jsonify([{
-        'id': c.id,
-        'name': c.name,
-        'email': c.email,
-        'phone': c.phone,
-        'address': c.address,
-        'city': c.city,
-        'state': c.state,
-        'zip_code': c.zip_code,
-        'notes': c.notes
-    } for c in customers])
+    limit, offset = _page_args()
+    # Rows come straight from SQL, skipping Customer models
+    fields = Customer.CONTACT_FIELDS
+    rows = Customer.get_contact_rows(search, limit, offset)
+    return jsonify([dict(zip(fields, row)) for row in rows])
 
 @flask_app.route('/api/customers', methods=['POST'])
 def create_customer():
-    data = request.json
+    data = request.get_json(cache=False)
     customer = Customer(
         name=data.get('name', ''),
         email=data.get('email', ''),
@@ -86,7 +110,7 @@ def update_customer(customer_id):
     if not customer:
         return jsonify({'error': 'Customer not found'}), 404
 
-    data = request.json
+    data = request.get_json(cache=False)
     customer.name = data.get('name', customer.name)
     customer.email = data.get('email', customer.email)
     customer.phone = data.get('phone', customer.phone)
@@ -110,11 +134,13 @@ def delete_customer(customer_id):
 @flask_app.route('/api/quotes', methods=['GET'])
 def get_quotes():
     status = request.args.get('status')
-    quotes = Quote.get_all(status=status if status else None)
+    limit, offset = _page_args()
+    # Listing rows carry the customer name from the join, without full models
+    quotes = Quote.get_all_rows(status=status if status else None, limit=limit, offset=offset)
     return jsonify([{
         'id': q.id,
         'quote_number': q.quote_number,
-        'customer_name': q.customer.name if q.customer else 'No customer',
+        'customer_name': q.customer_name or 'No customer',
         'gate_type': q.gate_type,
         'width': q.width,
         'height': q.height,
@@ -177,7 +203,7 @@ def get_quote(quote_id):
 
 @flask_app.route('/api/quotes', methods=['POST'])
 def create_quote():
-    data = request.json
+    data = request.get_json(cache=False)
     quote = Quote(
         customer_id=data.get('customer_id'),
         gate_type=data.get('gate_type', 'swing'),
@@ -216,7 +242,7 @@ def update_quote(quote_id):
     if not quote:
         return jsonify({'error': 'Quote not found'}), 404
 
-    data = request.json
+    data = request.get_json(cache=False)
     quote.customer_id = data.get('customer_id', quote.customer_id)
     quote.gate_type = data.get('gate_type', quote.gate_type)
     quote.gate_style = data.get('gate_style', quote.gate_style)
@@ -264,7 +290,7 @@ def update_quote_status(quote_id):
     if not quote:
         return jsonify({'error': 'Quote not found'}), 404
 
-    data = request.json
+    data = request.get_json(cache=False)
     quote.status = data.get('status', quote.status)
     quote.save()
     return jsonify({'success': True})
@@ -273,7 +299,7 @@ def update_quote_status(quote_id):
 
 @flask_app.route('/api/calculate', methods=['POST'])
 def calculate_quote():
-    data = request.json
+    data = request.get_json(cache=False)
     quote = Quote(
         gate_type=data.get('gate_type', 'swing'),
         gate_style=data.get('gate_style', 'standard'),
@@ -317,40 +343,60 @@ def generate_pdf(quote_id):
     if not quote:
         return jsonify({'error': 'Quote not found'}), 404
 
+    # Imported here so reportlab only loads once a PDF is actually requested
+    from app.services.pdf_generator import get_pdf_generator
     generator = get_pdf_generator()
-    pdf_path = generator.generate(quote)
+
+    # A client holding the current PDF gets a 304 without a render
+    etag = generator.cache_key(quote)
+    if request.if_none_match.contains(etag):
+        response = flask_app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+
+    pdf_data = generator.generate_bytes(quote)
 
     return send_file(
-        pdf_path,
+        io.BytesIO(pdf_data),
         mimetype='application/pdf',
         as_attachment=True,
-        download_name=f'Quote_{quote.quote_number}.pdf'
+        download_name=f'Quote_{quote.quote_number}.pdf',
+        etag=etag
     )
 
 # ============== Materials API ==============
 
+# Serialized /api/materials catalog and the materials version it was built from
+_materials_body = {'version': -1, 'body': None}
+
+# Material fields returned by the API, read in one call per material
+MATERIAL_FIELDS = ('id', 'category', 'name', 'unit', 'cost', 'markup', 'supplier', 'supplier_url')
+_material_values = attrgetter(*MATERIAL_FIELDS)
+
 @flask_app.route('/api/materials', methods=['GET'])
 def get_materials():
     category = request.args.get('category')
     search = request.args.get('search')
+    limit, offset = _page_args()
 
     if category:
-        materials = Material.get_by_category(category)
+        materials = Material.get_by_category(category, limit, offset)
     elif search:
-        materials = Material.search(search)
+        materials = Material.search(search, limit, offset)
+    elif limit is not None:
+        materials = Material.get_all(limit, offset)
     else:
-        materials = Material.get_all()
+        # The full catalog is serialized once per materials version
+        version = get_materials_version()
+        if _materials_body['version'] != version:
+            _materials_body['body'] = flask_app.json.dumps(_material_dicts(Material.get_all()))
+            _materials_body['version'] = version
+        return flask_app.response_class(_materials_body['body'], mimetype='application/json')
 
-    return jsonify([{
-        'id': m.id,
-        'category': m.category,
-        'name': m.name,
-        'unit': m.unit,
-        'cost': m.cost,
-        'markup': m.markup,
-        'supplier': m.supplier,
-        'supplier_url': m.supplier_url
-    } for m in materials])
+    return jsonify(_material_dicts(materials))
+
+def _material_dicts(materials):
+    return [dict(zip(MATERIAL_FIELDS, _material_values(m))) for m in materials]
 
 @flask_app.route('/api/materials/categories', methods=['GET'])
 def get_categories():
@@ -358,7 +404,7 @@ def get_categories():
 
 @flask_app.route('/api/materials', methods=['POST'])
 def create_material():
-    data = request.json
+    data = request.get_json(cache=False)
     material = Material(
         category=data.get('category', 'misc'),
         name=data.get('name', ''),
@@ -377,7 +423,7 @@ def update_material(material_id):
     if not material:
         return jsonify({'error': 'Material not found'}), 404
 
-    data = request.json
+    data = request.get_json(cache=False)
     material.category = data.get('category', material.category)
     material.name = data.get('name', material.name)
     material.unit = data.get('unit', material.unit)
@@ -399,7 +445,7 @@ def delete_material(material_id):
 
 @flask_app.route('/api/price-check', methods=['POST'])
 def check_price():
-    data = request.json
+    data = request.get_json(cache=False)
     url = data.get('url', '')
 
     if not url:
@@ -419,12 +465,16 @@ def check_price():
     else:
         return jsonify({'error': 'Could not fetch price'}), 400
 
+@lru_cache(maxsize=4096)
+def _supplier_urls_body(product: str) -> str:
+    """Serialized supplier search URLs for a product."""
+    return flask_app.json.dumps(get_supplier_api().get_search_urls(product))
+
 @flask_app.route('/api/supplier-search', methods=['GET'])
 def get_supplier_urls():
-    product = request.args.get('product', '')
-    api = get_supplier_api()
-    urls = api.get_search_urls(product)
-    return jsonify(urls)
+    # Supplier searches ignore case and edge whitespace, so variants share a cache entry
+    product = request.args.get('product', '').strip().lower()
+    return flask_app.response_class(_supplier_urls_body(product), mimetype='application/json')
 
 # ============== Settings API ==============
 
@@ -436,9 +486,8 @@ def get_settings():
 @flask_app.route('/api/settings', methods=['PUT'])
 def update_settings():
     db = get_db()
-    data = request.json
-    for key, value in data.items():
-        db.set_setting(key, str(value))
+    data = request.get_json(cache=False)
+    db.set_settings({key: str(value) for key, value in data.items()})
     return jsonify({'success': True})
 
 # ============== Run Server ==============